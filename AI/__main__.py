@@ -1,11 +1,28 @@
 """Run the FastAPI app via `python -m AI`."""
 from __future__ import annotations
 
+import os
+
 import uvicorn
 
 
 def main() -> None:
-    uvicorn.run("AI.app:app", host="0.0.0.0", port=8000, reload=True)
+    # Auto-reload is convenient during development but costs throughput; set
+    # AIBA_RELOAD=0 for production-style runs. The app must stay single-
+    # process either way: sessions, the response cache, and per-session
+    # indexes all live in process memory, so extra workers would route most
+    # requests to a process that has never seen the session.
+    reload = os.getenv("AIBA_RELOAD", "1") == "1"
+    uvicorn.run(
+        "AI.app:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=reload,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        workers=None if reload else 1,
+    )
 
 
 if __name__ == "__main__":
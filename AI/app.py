@@ -1,33 +1,50 @@
 """FastAPI application exposing the AI Business Analyst features."""
 from __future__ import annotations
 
-from typing import List
-
-from fastapi import Depends, FastAPI, File, HTTPException, Path, UploadFile
+import asyncio
+import hashlib
+import os
+from functools import partial
+from typing import Any, Dict, List, Tuple
+
+import orjson
+from anyio import to_thread
+from fastapi import (BackgroundTasks, Depends, FastAPI, File, HTTPException,
+                     Path, Request, Response, UploadFile)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from .cache import TTLCache, response_cache_key
 from .chunking import describe_chunkers
-from .features import FeatureContext, build_default_registry
+from .features import (FeatureContext, FeatureResult,
+                       build_default_registry)
 from .indexing import describe_indexers
 from .llm import get_default_client
 from .memory import Session, SessionManager
+from .memory.attachments import blob_size
 from .schemas import (AttachmentListResponse, AttachmentMetadata,
-                      AttachmentUploadResponse, ChatRequest, ChatResponse,
-                      ChunkingUpdateRequest, ErrorResponse,
+                      AttachmentUploadResponse, ChatMessage, ChatRequest,
+                      ChatResponse, ChunkingUpdateRequest, ErrorResponse,
                       EvaluationPerQueryResult, EvaluationRequest,
                       EvaluationResponse, FeatureDescriptor,
                       FeatureListResponse, FeatureName, IndexingUpdateRequest,
-                      SearchRequest, SearchResponse, SearchResult,
+                      SearchRequest, SearchResponse,
                       SessionCreateResponse, StrategyCatalogResponse,
                       StrategyDescriptor, TranscriptResponse)
 
 app = FastAPI(
     title="AIBA – AI Business Analyst Assistant",
     version="0.1.0",
+    # orjson serializes the list/score-heavy /search and /evaluation payloads
+    # several times faster than the stdlib json encoder.
+    default_response_class=ORJSONResponse,
 )
+# Explicit origins let Starlette serve its precomputed exact-match headers
+# instead of echoing the Origin per request, and a wildcard is not valid
+# alongside allow_credentials anyway.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=os.environ.get("AIBA_CORS_ORIGINS", "http://localhost:3000").split(","),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -36,6 +53,42 @@ app.add_middleware(
 _session_manager = SessionManager()
 _llm_client = get_default_client()
 _feature_registry = build_default_registry()
+# Entries pair the feature result with the state delta its run produced, so
+# a hit can replay the state writes as well as the response.
+_response_cache: TTLCache[Tuple[FeatureResult, Dict[str, Any]]] = TTLCache(
+    maxsize=1024, ttl=1800.0
+)
+# Features with side effects outside the session (reports written to disk
+# under the generating session's id) must run every time.
+_UNCACHEABLE_FEATURES = frozenset({"ba_report_export"})
+
+
+def _build_feature_catalog() -> FeatureListResponse:
+    """Precompute the feature catalog; descriptions are static metadata."""
+    features = [
+        FeatureDescriptor(key=FeatureName(key), description=description)
+        for key, _name, description in _feature_registry.descriptors()
+    ]
+    return FeatureListResponse(features=features)
+
+
+_feature_catalog = _build_feature_catalog()
+_strategy_catalog = StrategyCatalogResponse(
+    chunking=[StrategyDescriptor(**item) for item in describe_chunkers()],
+    indexing=[StrategyDescriptor(**item) for item in describe_indexers()],
+)
+
+# Both catalogs are immutable for the lifetime of the server, so clients can
+# cache them and revalidate with a startup-computed ETag (304, empty body).
+_CATALOG_CACHE_CONTROL = "public, max-age=3600"
+
+
+def _catalog_etag(payload: dict) -> str:
+    return '"%s"' % hashlib.blake2b(orjson.dumps(payload), digest_size=8).hexdigest()
+
+
+_FEATURES_ETAG = _catalog_etag(_feature_catalog.model_dump())
+_STRATEGIES_ETAG = _catalog_etag(_strategy_catalog.model_dump())
 
 
 def get_session(session_id: str = Path(..., description="Session identifier")) -> Session:
@@ -46,22 +99,14 @@ def get_session(session_id: str = Path(..., description="Session identifier")) -
 
 
 @app.get("/features", response_model=FeatureListResponse)
-def list_features() -> FeatureListResponse:
+async def list_features(request: Request) -> Response:
     """Enumerate available AI features."""
-    temp_session = _session_manager.create_session()
-    try:
-        ctx = FeatureContext(session=temp_session, llm=_llm_client)
-        features: list[FeatureDescriptor] = []
-        for key in _feature_registry.keys():
-            feature_instance = _feature_registry.create(key, ctx)
-            features.append(
-                FeatureDescriptor(
-                    key=FeatureName(key), description=feature_instance.description
-                )
-            )
-        return FeatureListResponse(features=features)
-    finally:
-        _session_manager.delete_session(temp_session.session_id)
+    if request.headers.get("if-none-match") == _FEATURES_ETAG:
+        return Response(status_code=304)
+    return ORJSONResponse(
+        _feature_catalog.model_dump(),
+        headers={"ETag": _FEATURES_ETAG, "Cache-Control": _CATALOG_CACHE_CONTROL},
+    )
 
 
 @app.post("/sessions", response_model=SessionCreateResponse)
@@ -80,8 +125,18 @@ def delete_session(session_id: str) -> None:
     response_model=TranscriptResponse,
     responses={404: {"model": ErrorResponse}},
 )
-def get_transcript(session: Session = Depends(get_session)) -> TranscriptResponse:
-    return TranscriptResponse(messages=session.memory.as_list())
+async def get_transcript(session: Session = Depends(get_session)) -> TranscriptResponse:
+    # Messages come straight from ConversationMemory, so both levels are
+    # built with model_construct — no validation pass, and the typed
+    # ChatMessage list serializes through pydantic-core's fast paths.
+    return TranscriptResponse.model_construct(
+        messages=[
+            ChatMessage.model_construct(
+                role=message.role, content=message.content, feature=message.feature
+            )
+            for message in session.memory.messages
+        ]
+    )
 
 
 @app.post(
@@ -91,33 +146,79 @@ def get_transcript(session: Session = Depends(get_session)) -> TranscriptRespons
 )
 def chat_with_feature(
     request: ChatRequest,
+    background_tasks: BackgroundTasks,
     session: Session = Depends(get_session),
-) -> ChatResponse:
+) -> ORJSONResponse:
     feature_key = request.feature.value
     ctx = FeatureContext(session=session, llm=_llm_client)
     try:
         feature = _feature_registry.create(feature_key, ctx)
     except KeyError as exc:  # pragma: no cover - defensive
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    # The user turn must land in memory before feature.run, which reads the
+    # transcript; the metadata bookkeeping is not consumed by the feature and
+    # can run after the response has been sent.
     session.memory.append("user", request.message, feature=feature_key)
+    cache_key: bytes | None = None
     if request.metadata:
-        session.set_state("last_metadata", request.metadata)
-    result = feature.run(request.message, context=ctx)
-    response = ChatResponse(
-        feature=request.feature,
-        title=result.title,
-        summary=result.summary,
-        data=result.data,
-        session_state=dict(session.state),
+        # Metadata makes the turn non-idempotent; never serve it from cache.
+        background_tasks.add_task(session.set_state, "last_metadata", request.metadata)
+    elif feature_key not in _UNCACHEABLE_FEATURES:
+        # The transcript feeds every feature prompt via as_prompt_list(), so
+        # it is fingerprinted alongside the state (the user turn above is
+        # included, matching what the feature would see).
+        cache_key = response_cache_key(
+            feature_key,
+            request.message,
+            session.state,
+            (
+                (message.role, message.content, message.feature)
+                for message in session.memory.messages
+            ),
+        )
+    cached = _response_cache.get(cache_key) if cache_key else None
+    if cached is None:
+        state_before = dict(session.state)
+        result = feature.run(request.message, context=ctx)
+        if cache_key:
+            # Capture the run's state writes so a hit replays them too.
+            # Values are stored by reference, consistent with set_state's
+            # own aliasing contract.
+            state_delta = {
+                key: value
+                for key, value in session.state.items()
+                if key not in state_before or state_before[key] is not value
+            }
+            _response_cache.put(cache_key, (result, state_delta))
+    else:
+        # Replay every session-side effect the feature run would have had:
+        # the assistant transcript entry and the state writes.
+        result, state_delta = cached
+        session.memory.append("feature", result.summary, feature=feature_key)
+        for key, value in state_delta.items():
+            session.set_state(key, value)
+    # data and session_state are arbitrary dicts; encoding them straight with
+    # orjson skips the Pydantic walk over every nested value. ChatResponse
+    # stays as the response_model for the OpenAPI schema.
+    return ORJSONResponse(
+        {
+            "feature": feature_key,
+            "title": result.title,
+            "summary": result.summary,
+            "data": result.data,
+            "session_state": session.state_snapshot(),
+        }
     )
-    return response
 
 
 @app.get("/strategies", response_model=StrategyCatalogResponse)
-def list_strategies() -> StrategyCatalogResponse:
-    chunking = [StrategyDescriptor(**item) for item in describe_chunkers()]
-    indexing = [StrategyDescriptor(**item) for item in describe_indexers()]
-    return StrategyCatalogResponse(chunking=chunking, indexing=indexing)
+async def list_strategies(request: Request) -> Response:
+    if request.headers.get("if-none-match") == _STRATEGIES_ETAG:
+        return Response(status_code=304)
+    return ORJSONResponse(
+        _strategy_catalog.model_dump(),
+        headers={"ETag": _STRATEGIES_ETAG, "Cache-Control": _CATALOG_CACHE_CONTROL},
+    )
 
 
 @app.get(
@@ -125,12 +226,12 @@ def list_strategies() -> StrategyCatalogResponse:
     response_model=AttachmentListResponse,
     responses={404: {"model": ErrorResponse}},
 )
-def list_attachments(session: Session = Depends(get_session)) -> AttachmentListResponse:
+async def list_attachments(session: Session = Depends(get_session)) -> AttachmentListResponse:
     attachments = [
         AttachmentMetadata(**attachment.as_dict(preview_chars=320))
         for attachment in session.list_attachments()
     ]
-    return AttachmentListResponse(attachments=attachments)
+    return AttachmentListResponse.model_construct(attachments=attachments)
 
 
 @app.post(
@@ -145,23 +246,34 @@ async def upload_attachments(
     if not files:
         raise HTTPException(status_code=400, detail="No files supplied")
     processed: List[AttachmentMetadata] = []
-    for file in files:
-        content = await file.read()
-        await file.close()
-        if not content:
-            continue
-        try:
-            attachment = session.add_attachment(
-                filename=file.filename or "attachment",
-                content_type=file.content_type or "application/octet-stream",
-                data=content,
-            )
-        except Exception as exc:  # pragma: no cover - defensive path
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        processed.append(AttachmentMetadata(**attachment.as_dict(preview_chars=320)))
+    try:
+        for file in files:
+            # Hand the spooled temporary file behind the upload straight to
+            # the extractor instead of materializing the payload in memory;
+            # anything beyond the spool threshold stays on disk.
+            if not blob_size(file.file):
+                continue
+            try:
+                # Extraction and chunking are CPU-bound; run them in the
+                # threadpool so the event loop stays responsive. Attachments
+                # are added one at a time because add_attachment rebuilds
+                # the session index and must not race itself.
+                attachment = await to_thread.run_sync(
+                    partial(
+                        session.add_attachment,
+                        filename=file.filename or "attachment",
+                        content_type=file.content_type or "application/octet-stream",
+                        data=file.file,
+                    )
+                )
+            except Exception as exc:  # pragma: no cover - defensive path
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            processed.append(AttachmentMetadata(**attachment.as_dict(preview_chars=320)))
+    finally:
+        await asyncio.gather(*(file.close() for file in files))
     if not processed:
         raise HTTPException(status_code=400, detail="Unable to process provided files")
-    return AttachmentUploadResponse(attachments=processed)
+    return AttachmentUploadResponse.model_construct(attachments=processed)
 
 
 @app.delete(
@@ -190,7 +302,7 @@ def set_chunking_strategy(
         session.set_chunking_strategy(request.strategy)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return dict(session.state)
+    return session.state_snapshot()
 
 
 @app.post(
@@ -206,7 +318,7 @@ def set_indexing_strategy(
         session.set_indexing_strategy(request.strategy)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return dict(session.state)
+    return session.state_snapshot()
 
 
 @app.post(
@@ -217,13 +329,20 @@ def set_indexing_strategy(
 def search_index(
     request: SearchRequest,
     session: Session = Depends(get_session),
-) -> SearchResponse:
+) -> ORJSONResponse:
     results = session.search(request.query, top_k=request.top_k)
-    payload = [
-        SearchResult(chunk=result.chunk, score=result.score, metadata=result.metadata)
-        for result in results
-    ]
-    return SearchResponse(results=payload)
+    # Results are encoded straight with orjson; routing them through
+    # SearchResult/SearchResponse would re-walk every chunk and metadata
+    # dict only to produce the same JSON. SearchResponse remains the
+    # response_model for the OpenAPI schema.
+    return ORJSONResponse(
+        {
+            "results": [
+                {"chunk": result.chunk, "score": result.score, "metadata": result.metadata}
+                for result in results
+            ]
+        }
+    )
 
 
 @app.post(
@@ -238,7 +357,7 @@ def evaluate_index(
     if not request.queries:
         raise HTTPException(status_code=400, detail="No queries provided for evaluation")
     evaluation = session.evaluate_retrieval(
-        [query.dict() for query in request.queries],
+        [query.model_dump() for query in request.queries],
         latency_samples_ms=request.latency_samples_ms,
         index_build_ms=request.index_build_ms,
         throughput_qps=request.throughput_qps,
@@ -269,5 +388,5 @@ def evaluate_index(
     response_model=dict,
     responses={404: {"model": ErrorResponse}},
 )
-def get_session_state(session: Session = Depends(get_session)) -> dict:
-    return dict(session.state)
+async def get_session_state(session: Session = Depends(get_session)) -> dict:
+    return session.state_snapshot()
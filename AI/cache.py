@@ -0,0 +1,70 @@
+"""In-process response cache for feature invocations."""
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Generic, Iterable, Mapping, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """Small thread-safe LRU cache whose entries expire after *ttl* seconds."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 1800.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, T]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: bytes) -> Optional[T]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: bytes, value: T) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:  # pragma: no cover - trivial
+        with self._lock:
+            return len(self._entries)
+
+
+def response_cache_key(
+    feature_key: str,
+    message: str,
+    state: Mapping[str, Any],
+    transcript: Iterable[Tuple[Any, ...]] = (),
+) -> bytes:
+    """Digest identifying a feature invocation against a session's inputs.
+
+    Features read both the state dict and the conversation transcript when
+    building prompts, so both are part of the key: a hit is only possible
+    when the feature would see exactly the inputs it saw when the entry was
+    cached.
+    """
+    fingerprint = repr(sorted(state.items(), key=lambda item: item[0]))
+    digest = hashlib.blake2b(
+        f"{feature_key}|{message.strip().lower()}|{fingerprint}|{list(transcript)!r}".encode(
+            "utf-8", "replace"
+        ),
+        digest_size=16,
+    )
+    return digest.digest()
@@ -1,35 +1,47 @@
 """Chunking strategy registry for document ingestion."""
 from __future__ import annotations
 
-from typing import Dict, Iterable, List
+from typing import Callable, Dict, Iterable, List
 
 from .base import ChunkingStrategy
 from .strategies import AllInOneChunker, FixedSizeChunker, SemanticChunker
 
-_CHUNKERS: Dict[str, ChunkingStrategy] = {
-    "all_in_one": AllInOneChunker(),
-    "fixed": FixedSizeChunker(),
-    "semantic": SemanticChunker(),
+_CHUNKER_FACTORIES: Dict[str, Callable[[], ChunkingStrategy]] = {
+    "all_in_one": AllInOneChunker,
+    "fixed": FixedSizeChunker,
+    "semantic": SemanticChunker,
 }
 
 
 def get_chunker(key: str) -> ChunkingStrategy:
     try:
-        return _CHUNKERS[key]
+        factory = _CHUNKER_FACTORIES[key]
     except KeyError as exc:  # pragma: no cover - defensive
         raise ValueError(f"Unknown chunking strategy '{key}'") from exc
+    return factory()
 
 
 def available_chunkers() -> Iterable[str]:
-    return _CHUNKERS.keys()
+    return _CHUNKER_FACTORIES.keys()
+
+
+def _build_chunker_catalog() -> List[dict]:
+    catalog: List[dict] = []
+    for name, factory in _CHUNKER_FACTORIES.items():
+        chunker = factory()
+        catalog.append(
+            {
+                "key": name,
+                "description": chunker.description,
+                "name": getattr(chunker, "name", name),
+            }
+        )
+    return catalog
+
+
+# Strategy metadata is static, so the catalog is built once at import time.
+_CHUNKER_CATALOG = _build_chunker_catalog()
 
 
 def describe_chunkers() -> List[dict]:
-    return [
-        {
-            "key": name,
-            "description": chunker.description,
-            "name": getattr(chunker, "name", name),
-        }
-        for name, chunker in _CHUNKERS.items()
-    ]
\ No newline at end of file
+    return _CHUNKER_CATALOG
\ No newline at end of file
@@ -2,28 +2,45 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Optional
-
-HeadingMetadata = Dict[str, Any]
-
-_NUMERIC_PATTERN = re.compile(r"^(?P<identifier>\d+(?:\.\d+)*)(?:[\.)-])?\s+(?P<title>.+)")
-_ROMAN_PATTERN = re.compile(
-    r"^(?P<identifier>[IVXLCDM]+)(?:[\.)-])?\s+(?P<title>.+)", re.IGNORECASE
-)
-_UPPER_ALPHA_PATTERN = re.compile(r"^(?P<identifier>[A-Z])(?:[\.)-])?\s+(?P<title>.+)")
-_LOWER_ALPHA_PATTERN = re.compile(r"^(?P<identifier>[a-z])(?:[\.)-])?\s+(?P<title>.+)")
-_UPPERCASE_WORDS_PATTERN = re.compile(r"^(?P<title>[A-Z][A-Z\s]{3,})$")
-_BULLET_PATTERN = re.compile(r"^(?P<identifier>[\-\*•])\s+(?P<title>.+)")
-
-_HEADING_PATTERNS = (
-    _NUMERIC_PATTERN,
-    _ROMAN_PATTERN,
-    _UPPER_ALPHA_PATTERN,
-    _LOWER_ALPHA_PATTERN,
-    _UPPERCASE_WORDS_PATTERN,
-    _BULLET_PATTERN,
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional
+
+# Read-only view over the heading fields; cached results are shared between
+# callers, so the mapping (and its "path" tuple) must not be mutated.
+HeadingMetadata = Mapping[str, Any]
+
+# The six heading shapes are unioned into one alternation so a single C-level
+# `re.match` classifies a line instead of six sequential pattern dispatches.
+# Each alternative carries uniquely named groups; `match.lastgroup` identifies
+# which shape matched. Alternatives are ordered to preserve the original
+# first-match-wins precedence (roman uses an explicit mixed-case class because
+# inline IGNORECASE must not leak into the alpha alternatives).
+_COMBINED_HEADING_PATTERN = re.compile(
+    r"^(?:"
+    r"(?P<num_id>\d+(?:\.\d+)*)(?:[\.)-])?\s+(?P<num_title>.+)"
+    r"|(?P<roman_id>[IVXLCDMivxlcdm]+)(?:[\.)-])?\s+(?P<roman_title>.+)"
+    r"|(?P<ualpha_id>[A-Z])(?:[\.)-])?\s+(?P<ualpha_title>.+)"
+    r"|(?P<lalpha_id>[a-z])(?:[\.)-])?\s+(?P<lalpha_title>.+)"
+    r"|(?P<upper_title>[A-Z][A-Z\s]{3,})$"
+    r"|(?P<bullet_id>[\-\*•])\s+(?P<bullet_title>.+)"
+    r")"
 )
 
+# Handlers keyed on the title group reported by `match.lastgroup`; each pulls
+# the (identifier, title) pair for its alternative straight from the match
+# object without building a groupdict. Uppercase headings carry no identifier
+# and bullets intentionally drop their marker: it is not a meaningful one.
+_HEADING_HANDLERS = {
+    "num_title": lambda m: (m.group("num_id"), m.group("num_title")),
+    "roman_title": lambda m: (m.group("roman_id"), m.group("roman_title")),
+    "ualpha_title": lambda m: (m.group("ualpha_id"), m.group("ualpha_title")),
+    "lalpha_title": lambda m: (m.group("lalpha_id"), m.group("lalpha_title")),
+    "upper_title": lambda m: (None, m.group("upper_title")),
+    "bullet_title": lambda m: (None, m.group("bullet_title")),
+}
+
 __all__ = ["detect_section_heading", "match_heading_line"]
 
 
@@ -37,39 +54,42 @@ def detect_section_heading(text: str, *, max_lines: int = 4) -> Optional[Heading
     return None
 
 
+# Common lines ("Introduction", "- item", ...) recur both within a document
+# and across attachments, so memoizing skips the regex and dict construction
+# for repeats. The cached mapping is immutable so sharing it is safe.
+@lru_cache(maxsize=8192)
 def match_heading_line(line: str) -> Optional[HeadingMetadata]:
     """Match a single line against known heading patterns."""
     stripped = line.strip()
     if not stripped:
         return None
 
-    for pattern in _HEADING_PATTERNS:
-        match = pattern.match(stripped)
-        if not match:
-            continue
-
-        groups = match.groupdict()
-        identifier = groups.get("identifier")
-        if pattern is _BULLET_PATTERN:
-            identifier = None
+    match = _COMBINED_HEADING_PATTERN.match(stripped)
+    if not match:
+        return None
 
-        title = groups.get("title") or stripped
-        title = _normalise_title(title)
+    identifier, title = _HEADING_HANDLERS[match.lastgroup](match)
+    title = _normalise_title(title or stripped)
+    normalised_identifier = _normalise_identifier(identifier)
 
-        heading: HeadingMetadata = {
+    return MappingProxyType(
+        {
             "heading": stripped,
-            "identifier": _normalise_identifier(identifier),
+            "identifier": normalised_identifier,
             "title": title,
+            "path": tuple(_derive_path(normalised_identifier, title)),
         }
-        heading["path"] = _derive_path(heading.get("identifier"), title)
-        return heading
-
-    return None
+    )
 
 
+# Titles and identifiers repeat heavily across headings ("Introduction",
+# "A", "1", ...), both within a document and across attachments. Interning
+# collapses the duplicates to one string object and lets downstream equality
+# checks short-circuit on identity; the LRU skips re-normalising repeats.
+@lru_cache(maxsize=4096)
 def _normalise_title(title: str) -> str:
     cleaned = " ".join(title.split())
-    return cleaned.strip()
+    return sys.intern(cleaned) if len(cleaned) < 64 else cleaned
 
 
 def _normalise_identifier(identifier: Optional[str]) -> Optional[str]:
@@ -81,11 +101,11 @@ def _normalise_identifier(identifier: Optional[str]) -> Optional[str]:
         return None
 
     if stripped.isalpha() and len(stripped) == 1:
-        return stripped.upper()
+        return sys.intern(stripped.upper())
     if re.fullmatch(r"[IVXLCDM]+", stripped, re.IGNORECASE):
-        return stripped.upper()
+        return sys.intern(stripped.upper())
 
-    return stripped
+    return sys.intern(stripped) if len(stripped) < 64 else stripped
 
 
 def _derive_path(identifier: Optional[str], title: str) -> List[str]:
@@ -1,6 +1,7 @@
 """Concrete chunking strategies."""
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import List
 
@@ -8,7 +9,7 @@ from .base import ChunkingStrategy
 from .sections import match_heading_line
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AllInOneChunker(ChunkingStrategy):
     name: str = "all_in_one"
     description: str = "Single chunk containing the entire document."
@@ -18,7 +19,7 @@ class AllInOneChunker(ChunkingStrategy):
         return [cleaned] if cleaned else []
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FixedSizeChunker(ChunkingStrategy):
     name: str = "fixed"
     description: str = "Fixed-length windows with configurable overlap."
@@ -31,46 +32,56 @@ class FixedSizeChunker(ChunkingStrategy):
             return []
         if len(cleaned) <= self.chunk_size:
             return [cleaned]
-        chunks: List[str] = []
-        start = 0
-        while start < len(cleaned):
-            end = start + self.chunk_size
-            chunks.append(cleaned[start:end])
-            if end >= len(cleaned):
-                break
-            start = max(end - self.overlap, start + 1)
-        return chunks
-
-
-@dataclass
+        step = max(self.chunk_size - self.overlap, 1)
+        # Stop at the first start whose window reaches the end of the text,
+        # i.e. all starts strictly below len - chunk_size + step.
+        starts = range(0, len(cleaned) - self.chunk_size + step, step)
+        return [cleaned[start : start + self.chunk_size] for start in starts]
+
+
+@dataclass(slots=True, frozen=True)
 class SemanticChunker(ChunkingStrategy):
     name: str = "semantic"
     description: str = "Heuristic semantic segmentation based on headings and paragraphs."
     min_chunk_size: int = 400
 
     def chunk(self, text: str) -> List[str]:
-        cleaned_lines = [line.strip() for line in text.splitlines()]
         segments: List[str] = []
         buffer: List[str] = []
+        # Running length of "\n".join(buffer); tracked incrementally so the
+        # size check stays O(1) instead of re-joining the buffer per line.
+        buffer_len = 0
 
         def flush() -> None:
-            nonlocal buffer
+            nonlocal buffer, buffer_len
             if not buffer:
                 return
             combined = "\n".join(buffer).strip()
             if combined:
                 segments.append(combined)
             buffer = []
-
-        for idx, line in enumerate(cleaned_lines):
-            if not line:
-                continue
-            if match_heading_line(line) and buffer:
+            buffer_len = 0
+
+        # One regex pass over the whole document: each match is a line with
+        # surrounding whitespace already removed, and blank lines yield no
+        # match at all, replacing splitlines() + per-line strip()/emptiness
+        # checks with a single descent into the regex engine.
+        for line_match in _STRIPPED_LINE_PATTERN.finditer(text):
+            line = line_match.group()
+            # Only lines opening with an alphanumeric or bullet marker can
+            # match a heading shape, and a heading only matters when there
+            # is buffered text to flush — skip the regex otherwise.
+            if (
+                buffer
+                and (line[0].isalnum() or line[0] in "-*•")
+                and match_heading_line(line)
+            ):
                 flush()
-                buffer.append(line)
-            else:
-                buffer.append(line)
-            if len("\n".join(buffer)) >= self.min_chunk_size:
+            if buffer:
+                buffer_len += 1  # joining newline
+            buffer.append(line)
+            buffer_len += len(line)
+            if buffer_len >= self.min_chunk_size:
                 flush()
 
         flush()
@@ -87,6 +98,20 @@ class SemanticChunker(ChunkingStrategy):
         return merged
 
 
+# Matches one stripped, non-empty line: from the first to the last
+# non-whitespace character, never crossing a str.splitlines boundary
+# (the negated class excludes every line-break character).
+_STRIPPED_LINE_PATTERN = re.compile(
+    r"\S[^\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]*\S|\S"
+)
+
+
+# A run of whitespace containing at least one line break (any str.splitlines
+# boundary), collapsed to a single newline in one C-level substitution.
+_NEWLINE_RUN_PATTERN = re.compile(
+    r"[^\S\n]*[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]\s*"
+)
+
+
 def _normalise_text(text: str) -> str:
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    return "\n".join(lines)
+    return _NEWLINE_RUN_PATTERN.sub("\n", text).strip()
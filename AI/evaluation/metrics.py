@@ -1,10 +1,12 @@
 """Ranking and efficiency metrics for retrieval evaluation."""
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Sequence
 
+import numpy as np
+
 
 def precision_at_k(relevance: Sequence[int], k: int) -> float:
     k = min(k, len(relevance))
@@ -31,19 +33,33 @@ def ndcg_at_k(gains: Sequence[float], k: int) -> float:
     k = min(k, len(gains))
     if k == 0:
         return 0.0
-    dcg = _discounted_cumulative_gain(gains, k)
-    ideal = _discounted_cumulative_gain(sorted(gains, reverse=True), k)
+    arr = np.asarray(gains, dtype=np.float64)
+    if arr.size > k:
+        # Only the k largest gains matter for the ideal ranking; partitioning
+        # is O(n) versus the full O(n log n) sort.
+        ideal_top = -np.partition(-arr, k - 1)[:k]
+        ideal_top.sort()
+        ideal_top = ideal_top[::-1]
+    else:
+        ideal_top = np.sort(arr)[::-1]
+    dcg = _discounted_cumulative_gain(arr[:k])
+    ideal = _discounted_cumulative_gain(ideal_top)
     if ideal == 0:
         return 0.0
     return dcg / ideal
 
 
-def _discounted_cumulative_gain(gains: Sequence[float], k: int) -> float:
-    score = 0.0
-    for idx in range(k):
-        gain = gains[idx]
-        score += (2**gain - 1) / math.log2(idx + 2)
-    return score
+# top_k is typically constant across the queries of an evaluation run, so the
+# discount vector is computed once per distinct k.
+@lru_cache(maxsize=64)
+def _dcg_discounts(k: int) -> np.ndarray:
+    discounts = np.log2(np.arange(2, k + 2, dtype=np.float64))
+    discounts.flags.writeable = False
+    return discounts
+
+
+def _discounted_cumulative_gain(gains: np.ndarray) -> float:
+    return float(((2.0**gains - 1.0) / _dcg_discounts(gains.size)).sum())
 
 
 @dataclass
@@ -55,21 +71,10 @@ class EfficiencyStats:
 
 
 def summarise_latency(samples_ms: Sequence[float]) -> tuple[float, float]:
-    if not samples_ms:
+    if len(samples_ms) == 0:
         return 0.0, 0.0
-    sorted_samples = sorted(samples_ms)
-    median = _percentile(sorted_samples, 0.5)
-    p95 = _percentile(sorted_samples, 0.95)
-    return median, p95
-
-
-def _percentile(values: Sequence[float], percentile: float) -> float:
-    if not values:
-        return 0.0
-    idx = percentile * (len(values) - 1)
-    lower = math.floor(idx)
-    upper = math.ceil(idx)
-    if lower == upper:
-        return values[int(idx)]
-    fraction = idx - lower
-    return values[lower] + (values[upper] - values[lower]) * fraction
+    # numpy sorts and linearly interpolates in C; its default method matches
+    # the floor/ceil interpolation the previous pure-Python version used.
+    arr = np.asarray(samples_ms, dtype=np.float64)
+    median, p95 = np.quantile(arr, (0.5, 0.95))
+    return float(median), float(p95)
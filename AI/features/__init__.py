@@ -25,18 +25,13 @@ __all__ = [
 
 def build_default_registry() -> FeatureRegistry:
     """Wire up the default set of AI BA features."""
-
-    def _factory(feature_cls):
-        def _create(context: FeatureContext):
-            return feature_cls(context)
-
-        return _create
-
+    # Feature classes take the context as their only constructor argument,
+    # so they are registered directly — no closure per feature.
     registry = FeatureRegistry()
-    registry.register("requirement_clarifier", _factory(RequirementClarifierFeature))
-    registry.register("use_case_generator", _factory(UseCaseGeneratorFeature))
-    registry.register("feature_prioritization", _factory(FeaturePrioritizationFeature))
-    registry.register("market_fit_analyzer", _factory(MarketFitAnalyzerFeature))
-    registry.register("stakeholder_insights", _factory(StakeholderInsightsFeature))
-    registry.register("ba_report_export", _factory(BAReportExporterFeature))
+    registry.register("requirement_clarifier", RequirementClarifierFeature)
+    registry.register("use_case_generator", UseCaseGeneratorFeature)
+    registry.register("feature_prioritization", FeaturePrioritizationFeature)
+    registry.register("market_fit_analyzer", MarketFitAnalyzerFeature)
+    registry.register("stakeholder_insights", StakeholderInsightsFeature)
+    registry.register("ba_report_export", BAReportExporterFeature)
     return registry
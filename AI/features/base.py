@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, Protocol
+from typing import Any, Callable, Dict, Iterable, List, Protocol, Tuple
 
 from ..llm import LLMClient
 from ..memory import Session
 
 
-@dataclass
+@dataclass(slots=True)
 class FeatureContext:
     """Runtime context passed to features when invoked."""
 
@@ -16,7 +16,7 @@ class FeatureContext:
     llm: LLMClient
 
 
-@dataclass
+@dataclass(slots=True)
 class FeatureResult:
     """Standardised response from a feature invocation."""
 
@@ -56,3 +56,18 @@ class FeatureRegistry:
 
     def keys(self) -> Iterable[str]:  # pragma: no cover - trivial container helper
         return self._factories.keys()
+
+    def descriptors(self) -> List[Tuple[str, str, str]]:
+        """Return (key, name, description) triples without building features.
+
+        name and description are class attributes on every registered
+        feature, so catalogs can be served straight off the factories.
+        """
+        return [
+            (
+                key,
+                getattr(factory, "name", key),
+                getattr(factory, "description", ""),
+            )
+            for key, factory in self._factories.items()
+        ]
@@ -19,7 +19,7 @@ class FeaturePrioritizationFeature:
 
     def run(self, user_input: str, *, context: FeatureContext | None = None) -> FeatureResult:
         ctx = context or self.context
-        history = ctx.session.memory.as_context()
+        history = ctx.session.memory.as_prompt_list()
         requirements = ctx.session.get_state("requirements") or []
         user_stories = ctx.session.get_state("user_stories") or []
         template = (
@@ -42,6 +42,7 @@ class FeaturePrioritizationFeature:
             user_prompt=prompt,
             default_title="Feature Prioritisation",
             history=history,
+            semantic_text=user_input,
         )
         prioritised = data.get("prioritised_features")
         if prioritised:
@@ -0,0 +1,78 @@
+"""Semantic response cache for LLM JSON requests."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..indexing.embedding import Vector, cosine_similarity, embed
+
+
+@dataclass
+class LLMCache:
+    """Near-duplicate message cache backed by bag-of-words embeddings.
+
+    Feature prompts are rebuilt from session state on every run, so reworded
+    or lightly edited inputs miss the exact-match digest cache while still
+    asking essentially the same question. Only the user-varying message is
+    embedded — the prompt scaffold (system template, session context,
+    history) dominates full-prompt vectors and made unrelated questions
+    look near-identical. Entries carry a caller-supplied *context* digest of
+    that scaffold, and lookups only compare entries from the same context,
+    returning the response whose cosine similarity clears *threshold*.
+    """
+
+    threshold: float = 0.92
+    maxsize: int = 128
+    ttl: float = 1800.0
+    _entries: List[Tuple[float, bytes, Vector, Dict[str, Any]]] = field(
+        default_factory=list, repr=False
+    )
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def embed_key(self, text: str) -> Vector:
+        return embed(text)
+
+    def lookup(self, context: bytes, key_vec: Vector) -> Optional[Dict[str, Any]]:
+        """Return the closest same-context response at or above the threshold.
+
+        The stored dict is returned by reference; callers must copy before
+        mutating, matching the exact-match cache contract.
+        """
+        if not key_vec:
+            return None
+        now = time.monotonic()
+        best: Optional[Dict[str, Any]] = None
+        best_score = self.threshold
+        with self._lock:
+            if any(expires_at < now for expires_at, _, _, _ in self._entries):
+                self._entries = [
+                    entry for entry in self._entries if entry[0] >= now
+                ]
+            for _, entry_context, vec, response in self._entries:
+                if entry_context != context:
+                    continue
+                score = cosine_similarity(key_vec, vec)
+                if score >= best_score:
+                    best = response
+                    best_score = score
+        return best
+
+    def put(self, context: bytes, key_vec: Vector, response: Dict[str, Any]) -> None:
+        if not key_vec:
+            return
+        with self._lock:
+            self._entries.append(
+                (time.monotonic() + self.ttl, context, key_vec, response)
+            )
+            while len(self._entries) > self.maxsize:
+                self._entries.pop(0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:  # pragma: no cover - trivial
+        with self._lock:
+            return len(self._entries)
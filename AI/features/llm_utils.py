@@ -1,11 +1,29 @@
 """Helpers to interact with the LLM client."""
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
-from typing import Any, Dict, Iterable, Sequence
+from typing import Any, Callable, Dict, Iterable, Sequence
 
+import orjson
+
+from ..cache import TTLCache
 from ..llm import LLMClient, LLMPrompt
 from ..memory import Session
+from .llm_cache import LLMCache
+
+# Re-running a feature on unchanged session state reproduces the exact same
+# prompt stack; caching by prompt digest turns that repeat round-trip into a
+# dict lookup. Entries are copied on the way in and out so callers can
+# mutate the returned dict freely.
+_PROMPT_CACHE: TTLCache[Dict[str, Any]] = TTLCache(maxsize=256, ttl=1800.0)
+
+# Second-level cache for messages that miss the digest above because they
+# were reworded or lightly edited. It only engages when callers pass
+# semantic_text (the raw user message): hits require an identical prompt
+# scaffold plus high cosine similarity between the message embeddings.
+_SEMANTIC_CACHE = LLMCache()
 
 
 def request_json_response(
@@ -14,20 +32,60 @@ def request_json_response(
     system_prompt: str,
     user_prompt: str,
     default_title: str,
-    history: Sequence[dict] | None = None,
+    history: Sequence[dict] | Sequence[LLMPrompt] | None = None,
+    use_cache: bool = True,
+    semantic_text: str | None = None,
+    on_delta: Callable[[str], None] | None = None,
 ) -> Dict[str, Any]:
-    """Ask the LLM for a JSON object, falling back to raw text if decoding fails."""
-    prompts: list[LLMPrompt] = [LLMPrompt(role="system", content=system_prompt)]
+    """Ask the LLM for a JSON object, falling back to raw text if decoding fails.
+
+    When *on_delta* is given the completion is streamed: each text delta is
+    forwarded to the callback as it arrives and the full response is parsed
+    once at the end, so partial output can be surfaced without re-parsing the
+    growing buffer. Cache hits return immediately without emitting deltas.
+
+    *semantic_text* is the user-varying part of the prompt (the raw message,
+    not the scaffold around it). Passing it opts the call into the semantic
+    near-duplicate cache; without it only the exact-digest cache applies.
+    """
+    cache_key: bytes | None = None
+    semantic_key: tuple[bytes, Any] | None = None
+    if use_cache:
+        cache_key = _prompt_cache_key(llm, system_prompt, user_prompt, history)
+        cached = _PROMPT_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        if semantic_text:
+            semantic_key = (
+                _semantic_context_key(llm, system_prompt, user_prompt, semantic_text, history),
+                _SEMANTIC_CACHE.embed_key(semantic_text),
+            )
+            cached = _SEMANTIC_CACHE.lookup(*semantic_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+    # System templates are static per feature, so they are flagged as a
+    # cacheable prefix for providers that support KV/prompt caching.
+    prompts: list[LLMPrompt] = [LLMPrompt(role="system", content=system_prompt, cache=True)]
     if history:
-        prompts.extend(
-            LLMPrompt(role=entry.get("role", "assistant"), content=entry.get("content", ""))
-            for entry in history
-        )
+        if isinstance(history[0], LLMPrompt):
+            # Already-prepared prompts (e.g. memory.as_prompt_list()) are
+            # spliced in by reference instead of rebuilt per call.
+            prompts.extend(history)
+        else:
+            prompts.extend(
+                LLMPrompt(role=entry.get("role", "assistant"), content=entry.get("content", ""))
+                for entry in history
+            )
     prompts.append(LLMPrompt(role="user", content=user_prompt))
-    raw = llm.generate(
-        prompts,
-        extra={"response_format": {"type": "json_object"}},
-    )
+    extra = {"response_format": {"type": "json_object"}}
+    if on_delta is not None:
+        parts: list[str] = []
+        for delta in llm.generate_stream(prompts, extra=extra):
+            parts.append(delta)
+            on_delta(delta)
+        raw = "".join(parts)
+    else:
+        raw = llm.generate(prompts, extra=extra)
     if not raw:
         return {"title": default_title, "summary": ""}
     try:
@@ -36,9 +94,49 @@ def request_json_response(
         data = {"title": default_title, "summary": raw}
     if "title" not in data:
         data["title"] = default_title
+    if cache_key is not None:
+        stored = copy.deepcopy(data)
+        _PROMPT_CACHE.put(cache_key, stored)
+        if semantic_key is not None:
+            _SEMANTIC_CACHE.put(*semantic_key, stored)
     return data
 
 
+def _semantic_context_key(
+    llm: LLMClient,
+    system_prompt: str,
+    user_prompt: str,
+    semantic_text: str,
+    history: Sequence[dict] | Sequence[LLMPrompt] | None,
+) -> bytes:
+    """Digest of the prompt scaffold with the user-varying text blanked out.
+
+    Semantic hits are only allowed between prompts that are identical except
+    for the message being embedded, so everything else — model, system
+    template, session context, history — must digest to the same value.
+    """
+    return _prompt_cache_key(
+        llm, system_prompt, user_prompt.replace(semantic_text, "\x00"), history
+    )
+
+
+def _prompt_cache_key(
+    llm: LLMClient,
+    system_prompt: str,
+    user_prompt: str,
+    history: Sequence[dict] | Sequence[LLMPrompt] | None,
+) -> bytes:
+    digest = hashlib.sha256()
+    digest.update(str(getattr(llm, "model", type(llm).__name__)).encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(system_prompt.encode("utf-8", "replace"))
+    digest.update(b"\x00")
+    digest.update(user_prompt.encode("utf-8", "replace"))
+    digest.update(b"\x00")
+    digest.update(orjson.dumps(list(history or []), option=orjson.OPT_SORT_KEYS, default=str))
+    return digest.digest()
+
+
 def build_attachment_context(
     session: Session,
     *,
@@ -19,7 +19,7 @@ class MarketFitAnalyzerFeature:
 
     def run(self, user_input: str, *, context: FeatureContext | None = None) -> FeatureResult:
         ctx = context or self.context
-        history = ctx.session.memory.as_context()
+        history = ctx.session.memory.as_prompt_list()
         template = (
             "You are an AI strategist. Produce a JSON object with keys: title, summary, "
             "competitive_landscape (list of objects with name, positioning, strengths, gaps), "
@@ -42,6 +42,7 @@ class MarketFitAnalyzerFeature:
             user_prompt=prompt,
             default_title="Market Fit Analysis",
             history=history,
+            semantic_text=user_input,
         )
         if data.get("competitive_landscape"):
             ctx.session.set_state("competitive_landscape", data["competitive_landscape"])
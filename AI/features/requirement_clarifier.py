@@ -2,11 +2,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from string import Template
 from typing import Any, Dict
 
 from .base import FeatureContext, FeatureResult
 from .llm_utils import build_attachment_context, request_json_response
 
+# Prompt templates are static, so they are assembled once at import and
+# filled per call in a single substitution pass.
+_SYSTEM_TEMPLATE = (
+    "You are an AI Business Analyst helping student teams refine their project idea. "
+    "Generate a JSON object with keys: title, summary, clarifying_questions (list of "
+    "strings), assumptions (list of strings), and requirement_backlog (list of objects "
+    "with fields id, requirement, rationale). Use the project context provided."
+)
+_PROMPT_TEMPLATE = Template(
+    "Current project context and notes:\n"
+    "$project_overview\n\n"
+    "Supporting documents summary:\n"
+    "$attachments\n\n"
+    "New user input: $user_input\n\n"
+    "If previous decisions exist, ensure you respect them."
+)
+
 
 @dataclass
 class RequirementClarifierFeature:
@@ -19,28 +37,19 @@ class RequirementClarifierFeature:
 
     def run(self, user_input: str, *, context: FeatureContext | None = None) -> FeatureResult:
         ctx = context or self.context
-        history = ctx.session.memory.as_context()
-        template = (
-            "You are an AI Business Analyst helping student teams refine their project idea. "
-            "Generate a JSON object with keys: title, summary, clarifying_questions (list of "
-            "strings), assumptions (list of strings), and requirement_backlog (list of objects "
-            "with fields id, requirement, rationale). Use the project context provided."
-        )
-        prompt = (
-            "Current project context and notes:\n"
-            f"{ctx.session.get_state('project_overview', 'N/A')}\n\n"
-            "Supporting documents summary:\n"
-            f"{build_attachment_context(ctx.session)}\n\n"
-            "New user input: "
-            f"{user_input}\n\n"
-            "If previous decisions exist, ensure you respect them."
+        history = ctx.session.memory.as_prompt_list()
+        prompt = _PROMPT_TEMPLATE.substitute(
+            project_overview=ctx.session.get_state("project_overview", "N/A"),
+            attachments=build_attachment_context(ctx.session),
+            user_input=user_input,
         )
         data: Dict[str, Any] = request_json_response(
             ctx.llm,
-            system_prompt=template,
+            system_prompt=_SYSTEM_TEMPLATE,
             user_prompt=prompt,
             default_title="Requirement Clarification",
             history=history,
+            semantic_text=user_input,
         )
         summary = data.get("summary") or user_input
         ctx.session.memory.append(
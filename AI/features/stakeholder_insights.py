@@ -2,11 +2,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from string import Template
 from typing import Any, Dict
 
 from .base import FeatureContext, FeatureResult
 from .llm_utils import build_attachment_context, request_json_response
 
+# Static prompt scaffolding built once at import; run() fills it in a single
+# substitution pass.
+_SYSTEM_TEMPLATE = (
+    "Operate as an AI Business Analyst building a stakeholder map. Produce JSON with keys: "
+    "title, summary, stakeholder_map (list of objects with stakeholder, influence, interest, "
+    "needs, success_metrics), engagement_plan (list of strings), and communication_cadence "
+    "(list of objects with stakeholder, channel, frequency, owner)."
+)
+_PROMPT_TEMPLATE = Template(
+    "Project summary: $project_overview\n"
+    "Existing stakeholders: $stakeholders\n"
+    "Supporting attachments:\n"
+    "$attachments\n"
+    "User prompt: $user_input"
+)
+
 
 @dataclass
 class StakeholderInsightsFeature:
@@ -19,29 +36,20 @@ class StakeholderInsightsFeature:
 
     def run(self, user_input: str, *, context: FeatureContext | None = None) -> FeatureResult:
         ctx = context or self.context
-        history = ctx.session.memory.as_context()
-        template = (
-            "Operate as an AI Business Analyst building a stakeholder map. Produce JSON with keys: "
-            "title, summary, stakeholder_map (list of objects with stakeholder, influence, interest, "
-            "needs, success_metrics), engagement_plan (list of strings), and communication_cadence "
-            "(list of objects with stakeholder, channel, frequency, owner)."
-        )
-        prompt = (
-            "Project summary: "
-            f"{ctx.session.get_state('project_overview', 'N/A')}\n"
-            "Existing stakeholders: "
-            f"{ctx.session.get_state('stakeholder_map', 'None yet')}\n"
-            "Supporting attachments:\n"
-            f"{build_attachment_context(ctx.session)}\n"
-            "User prompt: "
-            f"{user_input}"
+        history = ctx.session.memory.as_prompt_list()
+        prompt = _PROMPT_TEMPLATE.substitute(
+            project_overview=ctx.session.get_state("project_overview", "N/A"),
+            stakeholders=ctx.session.get_state("stakeholder_map", "None yet"),
+            attachments=build_attachment_context(ctx.session),
+            user_input=user_input,
         )
         data: Dict[str, Any] = request_json_response(
             ctx.llm,
-            system_prompt=template,
+            system_prompt=_SYSTEM_TEMPLATE,
             user_prompt=prompt,
             default_title="Stakeholder Insights",
             history=history,
+            semantic_text=user_input,
         )
         stakeholder_map = data.get("stakeholder_map")
         if stakeholder_map:
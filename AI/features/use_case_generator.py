@@ -2,11 +2,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from string import Template
 from typing import Any, Dict
 
 from .base import FeatureContext, FeatureResult
 from .llm_utils import build_attachment_context, request_json_response
 
+# Static prompt scaffolding built once at import; run() fills it in a single
+# substitution pass.
+_SYSTEM_TEMPLATE = (
+    "You are an AI Business Analyst. Produce a JSON object with keys: title, summary, "
+    "user_stories (list of objects with fields id, role, goal, benefit), use_case_flows "
+    "(list of objects with name, primary_path, alternate_paths), and acceptance_criteria "
+    "(list of strings). Base your answer on the requirements and conversation."
+)
+_PROMPT_TEMPLATE = Template(
+    "Known requirements backlog:\n"
+    "$requirements\n\n"
+    "Dataset from attachments:\n"
+    "$attachments\n\n"
+    "Additional guidance: $user_input"
+)
+
 
 @dataclass
 class UseCaseGeneratorFeature:
@@ -19,28 +36,20 @@ class UseCaseGeneratorFeature:
 
     def run(self, user_input: str, *, context: FeatureContext | None = None) -> FeatureResult:
         ctx = context or self.context
-        history = ctx.session.memory.as_context()
+        history = ctx.session.memory.as_prompt_list()
         requirements = ctx.session.get_state("requirements")
-        template = (
-            "You are an AI Business Analyst. Produce a JSON object with keys: title, summary, "
-            "user_stories (list of objects with fields id, role, goal, benefit), use_case_flows "
-            "(list of objects with name, primary_path, alternate_paths), and acceptance_criteria "
-            "(list of strings). Base your answer on the requirements and conversation."
-        )
-        prompt = (
-            "Known requirements backlog:\n"
-            f"{requirements if requirements else 'No formal requirements yet.'}\n\n"
-            "Dataset from attachments:\n"
-            f"{build_attachment_context(ctx.session)}\n\n"
-            "Additional guidance: "
-            f"{user_input}"
+        prompt = _PROMPT_TEMPLATE.substitute(
+            requirements=requirements if requirements else "No formal requirements yet.",
+            attachments=build_attachment_context(ctx.session),
+            user_input=user_input,
         )
         data: Dict[str, Any] = request_json_response(
             ctx.llm,
-            system_prompt=template,
+            system_prompt=_SYSTEM_TEMPLATE,
             user_prompt=prompt,
             default_title="Use Case Package",
             history=history,
+            semantic_text=user_input,
         )
         if data.get("user_stories"):
             ctx.session.set_state("user_stories", data["user_stories"])
@@ -1,7 +1,8 @@
 """Indexing strategy registry and helpers."""
 from __future__ import annotations
 
-from typing import Callable, Dict, Iterable, List
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Tuple
 
 from .base import IndexingStrategy, NullIndex
 from .faiss_like import FaissLikeIndex
@@ -26,7 +27,10 @@ def available_indexers() -> Iterable[str]:
     return _INDEXER_FACTORIES.keys()
 
 
-def describe_indexers() -> List[dict]:
+@lru_cache(maxsize=1)
+def _indexer_descriptions() -> Tuple[dict, ...]:
+    # The registry is fixed at import time, so the throwaway instances built
+    # just to read their descriptions are only ever constructed once.
     descriptions: List[dict] = []
     for key, factory in _INDEXER_FACTORIES.items():
         instance = factory()
@@ -37,4 +41,8 @@ def describe_indexers() -> List[dict]:
                 "name": getattr(instance, "name", key),
             }
         )
-    return descriptions
+    return tuple(descriptions)
+
+
+def describe_indexers() -> List[dict]:
+    return [dict(entry) for entry in _indexer_descriptions()]
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Protocol, Sequence, Tuple
+from itertools import chain, repeat
+from typing import Dict, List, Optional, Protocol, Sequence
 
 
 @dataclass
@@ -31,9 +32,15 @@ class IndexingStrategy(Protocol):
     ) -> None:
         ...
 
+    def remove_by_document_id(self, document_id: str) -> int:
+        ...
+
     def search(self, query: str, *, top_k: int = 5) -> List[IndexResult]:
         ...
 
+    def search_batch(self, queries: Sequence[str], *, top_k: int = 5) -> List[List[IndexResult]]:
+        ...
+
 
 @dataclass
 class NullIndex:
@@ -41,10 +48,22 @@ class NullIndex:
 
     name: str = "none"
     description: str = "No indexing; linear scan performed on demand."
-    _documents: List[Tuple[str, Optional[dict]]] = field(default_factory=list)
+    # Chunks and metadata live in parallel lists so ingestion is two bulk
+    # extends instead of building a tuple per chunk. Lowercased chunks are
+    # kept alongside so searches do not re-lower the corpus per query.
+    _chunks: List[str] = field(default_factory=list)
+    _chunks_lower: List[str] = field(default_factory=list)
+    _metas: List[Optional[dict]] = field(default_factory=list)
+    # Section ranks resolved at ingest so the per-query aggregation does not
+    # need to copy metadata for matches that fall outside top_k.
+    _section_ranks: List[str] = field(default_factory=list)
 
     def reset(self) -> None:
-        self._documents = []
+        # Clear in place so a reused instance keeps its list allocations.
+        self._chunks.clear()
+        self._chunks_lower.clear()
+        self._metas.clear()
+        self._section_ranks.clear()
 
     def add_documents(
         self,
@@ -52,31 +71,58 @@ class NullIndex:
         *,
         metadata: Optional[Sequence[Optional[dict]]] = None,
     ) -> None:
-        meta_seq: Sequence[Optional[dict]]
+        self._chunks.extend(documents)
+        self._chunks_lower.extend(map(str.lower, documents))
         if metadata is None:
-            meta_seq = [None] * len(documents)
+            self._metas.extend(repeat(None, len(documents)))
         else:
-            meta_seq = metadata
-        for idx, chunk in enumerate(documents):
-            meta = meta_seq[idx] if idx < len(meta_seq) else None
-            self._documents.append((chunk, meta))
+            # Pad with None when metadata is shorter than documents.
+            self._metas.extend(
+                meta for _, meta in zip(documents, chain(metadata, repeat(None)))
+            )
+        self._section_ranks.extend(
+            _derive_section_rank(dict(meta) if meta else None)
+            for meta in self._metas[len(self._section_ranks):]
+        )
+
+    def remove_by_document_id(self, document_id: str) -> int:
+        keep = [
+            row
+            for row, meta in enumerate(self._metas)
+            if not meta or meta.get("document_id") != document_id
+        ]
+        removed = len(self._metas) - len(keep)
+        if removed:
+            self._chunks = [self._chunks[row] for row in keep]
+            self._chunks_lower = [self._chunks_lower[row] for row in keep]
+            self._metas = [self._metas[row] for row in keep]
+            self._section_ranks = [self._section_ranks[row] for row in keep]
+        return removed
 
     def search(self, query: str, *, top_k: int = 5) -> List[IndexResult]:
-        if not query or not self._documents:
+        if not query or not self._chunks:
             return []
-        matches: List[IndexResult] = []
+        query_lower = query.lower()
+        match_rows: List[int] = []
         section_scores: Dict[str, float] = {}
-        for chunk, meta in self._documents:
-            if query.lower() in chunk.lower():
-                meta_copy = dict(meta or {})
-                matches.append(IndexResult(chunk=chunk, score=1.0, metadata=meta_copy))
-                rank = _derive_section_rank(meta_copy)
-                section_scores[rank] = max(section_scores.get(rank, 0.0), 1.0)
-        for match in matches:
-            meta = match.metadata or {}
-            rank = _derive_section_rank(meta)
-            meta["section_score"] = section_scores.get(rank, match.score)
-        return matches[:top_k]
+        ranks = self._section_ranks
+        for row, chunk_lower in enumerate(self._chunks_lower):
+            if query_lower in chunk_lower:
+                match_rows.append(row)
+                section_scores[ranks[row]] = 1.0
+        # Metadata is copied only for the returned slice, not every match.
+        matches: List[IndexResult] = []
+        for row in match_rows[:top_k]:
+            meta = self._metas[row]
+            meta = dict(meta) if meta else {}
+            if meta:
+                rank = _derive_section_rank(meta)
+                meta["section_score"] = section_scores.get(rank, 1.0)
+            matches.append(IndexResult(chunk=self._chunks[row], score=1.0, metadata=meta))
+        return matches
+
+    def search_batch(self, queries: Sequence[str], *, top_k: int = 5) -> List[List[IndexResult]]:
+        return [self.search(query, top_k=top_k) for query in queries]
 
 
 def _derive_section_rank(meta: dict | None) -> str:
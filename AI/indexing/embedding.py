@@ -4,6 +4,7 @@ from __future__ import annotations
 import math
 import re
 from collections import Counter
+from functools import lru_cache
 from typing import Dict
 
 Vector = Dict[str, float]
@@ -11,22 +12,35 @@ _TOKEN_PATTERN = re.compile(r"[\w']+")
 
 
 def embed(text: str) -> Vector:
-    tokens = _TOKEN_PATTERN.findall(text.lower())
-    if not tokens:
+    # Lowering per token instead of copying the whole text keeps the pipeline
+    # (findall -> map -> Counter) in C and avoids a transient full-size string
+    # for large chunks; [\w']+ spans the same tokens either way.
+    counts = Counter(map(str.lower, _TOKEN_PATTERN.findall(text)))
+    if not counts:
         return {}
-    counts = Counter(tokens)
     norm = math.sqrt(sum(value * value for value in counts.values()))
     if norm == 0:
         return dict(counts)
     return {token: value / norm for token, value in counts.items()}
 
 
+@lru_cache(maxsize=4096)
+def cached_embed(text: str) -> Vector:
+    """Memoized :func:`embed` for corpus chunks.
+
+    Switching chunking or indexing strategies rebuilds indexes over the same
+    attachment chunks, so the vectors are computed once and shared. The
+    returned dict is reused between callers and must not be mutated.
+    """
+    return embed(text)
+
+
 def cosine_similarity(left: Vector, right: Vector) -> float:
     if not left or not right:
         return 0.0
-    if len(left) > len(right):
-        left, right = right, left
+    # Intersecting the key sets first happens in C and skips every missed
+    # dict.get probe, which dominates when the vectors barely overlap.
     score = 0.0
-    for token, weight in left.items():
-        score += weight * right.get(token, 0.0)
+    for token in left.keys() & right.keys():
+        score += left[token] * right[token]
     return score
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence
+from itertools import chain, repeat
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .base import IndexingStrategy, IndexResult
-from .embedding import cosine_similarity, embed
+from .embedding import Vector, cached_embed, cosine_similarity, embed
 
 
 @dataclass
@@ -14,19 +17,36 @@ class _SectionNode:
     chunks: List[str]
     metadata: Optional[dict]
     path: List[str]
+    # Embeddings cached on the node; refresh() recomputes them only when
+    # chunks have been added since the last search, so queries score against
+    # precomputed vectors instead of re-embedding the section text.
+    combined_text: str = ""
+    section_vec: Optional[Vector] = None
+    chunk_vecs: List[Vector] = field(default_factory=list)
 
     def all_chunks(self) -> List[str]:
         return list(self.chunks)
 
+    def refresh(self) -> None:
+        if self.section_vec is not None and len(self.chunk_vecs) == len(self.chunks):
+            return
+        self.combined_text = "\n".join(self.chunks)
+        self.section_vec = embed(self.combined_text)
+        for chunk in self.chunks[len(self.chunk_vecs):]:
+            self.chunk_vecs.append(cached_embed(chunk))
+
 
 @dataclass
 class _DocumentNode:
     doc_id: str
-    sections: List[_SectionNode] = field(default_factory=list)
+    # Sections keyed by their path tuple (insertion-ordered), so chunk
+    # ingestion and search expansion resolve a section in one lookup instead
+    # of scanning the section list per chunk.
+    sections: Dict[Tuple[str, ...], _SectionNode] = field(default_factory=dict)
 
     def all_chunks(self) -> List[str]:
         collected: List[str] = []
-        for section in self.sections:
+        for section in self.sections.values():
             collected.extend(section.all_chunks())
         return collected
 
@@ -38,9 +58,16 @@ class LlamaIndexStub(IndexingStrategy):
     name: str = "llama_index"
     description: str = "Hierarchy: document → section → chunk with cosine scoring."
     _documents: Dict[str, _DocumentNode] = field(default_factory=dict)
+    # All section vectors stacked into one dense (sections x vocabulary)
+    # matrix, rebuilt lazily after ingestion; scoring every section is then a
+    # single matrix-vector product instead of a nested Python loop.
+    _section_refs: List[Tuple[str, _SectionNode]] = field(default_factory=list, repr=False)
+    _section_vocab: Dict[str, int] = field(default_factory=dict, repr=False)
+    _section_matrix: Optional[np.ndarray] = field(default=None, repr=False)
 
     def reset(self) -> None:
         self._documents.clear()
+        self._section_matrix = None
 
     def add_documents(
         self,
@@ -48,13 +75,8 @@ class LlamaIndexStub(IndexingStrategy):
         *,
         metadata: Optional[Sequence[Optional[dict]]] = None,
     ) -> None:
-        meta_seq: Sequence[Optional[dict]]
-        if metadata is None:
-            meta_seq = [None] * len(documents)
-        else:
-            meta_seq = metadata
-        for idx, chunk in enumerate(documents):
-            meta = meta_seq[idx] if idx < len(meta_seq) else None
+        meta_iter = chain(metadata, repeat(None)) if metadata is not None else repeat(None)
+        for idx, (chunk, meta) in enumerate(zip(documents, meta_iter)):
             base_meta = dict(meta or {})
             doc_key = base_meta.get("document_id", f"doc_{idx}")
             section_heading = (
@@ -70,7 +92,8 @@ class LlamaIndexStub(IndexingStrategy):
             if not section_path:
                 section_path = [section_heading]
             node = self._documents.setdefault(doc_key, _DocumentNode(doc_id=doc_key))
-            section = next((s for s in node.sections if s.path == section_path), None)
+            path_key = tuple(section_path)
+            section = node.sections.get(path_key)
             if section is None:
                 section_meta = {
                     **base_meta,
@@ -84,36 +107,81 @@ class LlamaIndexStub(IndexingStrategy):
                     metadata=section_meta,
                     path=section_path,
                 )
-                node.sections.append(section)
+                node.sections[path_key] = section
             section.chunks.append(chunk)
+        self._section_matrix = None
+
+    def remove_by_document_id(self, document_id: str) -> int:
+        node = self._documents.pop(document_id, None)
+        if node is None:
+            return 0
+        self._section_matrix = None
+        return sum(len(section.chunks) for section in node.sections.values())
+
+    def _build_section_matrix(self) -> None:
+        refs: List[Tuple[str, _SectionNode]] = []
+        for node in self._documents.values():
+            for section in node.sections.values():
+                section.refresh()
+                refs.append((node.doc_id, section))
+        vocab: Dict[str, int] = {}
+        for _, section in refs:
+            for token in section.section_vec or {}:
+                if token not in vocab:
+                    vocab[token] = len(vocab)
+        matrix = np.zeros((len(refs), len(vocab)), dtype=np.float32)
+        for row, (_, section) in enumerate(refs):
+            for token, weight in (section.section_vec or {}).items():
+                matrix[row, vocab[token]] = weight
+        self._section_refs = refs
+        self._section_vocab = vocab
+        self._section_matrix = matrix
 
     def search(self, query: str, *, top_k: int = 5) -> List[IndexResult]:
         if not query or not self._documents:
             return []
         query_vec = embed(query)
-        section_scores: List[IndexResult] = []
-        for node in self._documents.values():
-            for section in node.sections:
-                combined_text = "\n".join(section.chunks)
-                score = cosine_similarity(query_vec, embed(combined_text))
-                if score <= 0:
-                    continue
-                section_meta = dict(section.metadata or {})
-                section_meta.update(
-                    {
-                        "document_id": node.doc_id,
-                        "chunk_count": len(section.chunks),
-                    }
-                )
-                section_scores.append(
-                    IndexResult(
-                        chunk=combined_text,
-                        score=float(score),
-                        metadata=section_meta,
-                    )
+        if self._section_matrix is None:
+            self._build_section_matrix()
+        dense_query = np.zeros(len(self._section_vocab), dtype=np.float32)
+        for token, weight in query_vec.items():
+            idx = self._section_vocab.get(token)
+            if idx is not None:
+                dense_query[idx] = weight
+        scores = self._section_matrix @ dense_query
+        positive = np.flatnonzero(scores > 0)
+        if positive.size == 0:
+            return []
+        positive_scores = scores[positive]
+        # As in FaissLikeIndex: partition to the top_k boundary, keep every
+        # row tied with the k-th score, then stable-sort the candidates to
+        # reproduce the previous full-sort ordering.
+        if positive.size > top_k > 0:
+            kth = -np.partition(-positive_scores, top_k - 1)[top_k - 1]
+            keep = positive_scores >= kth
+            candidates = positive[keep]
+            candidate_scores = positive_scores[keep]
+        else:
+            candidates = positive
+            candidate_scores = positive_scores
+        order = candidates[np.argsort(-candidate_scores, kind="stable")][:top_k]
+        top_sections: List[IndexResult] = []
+        for row in order.tolist():
+            doc_id, section = self._section_refs[row]
+            section_meta = dict(section.metadata or {})
+            section_meta.update(
+                {
+                    "document_id": doc_id,
+                    "chunk_count": len(section.chunks),
+                }
+            )
+            top_sections.append(
+                IndexResult(
+                    chunk=section.combined_text,
+                    score=float(scores[row]),
+                    metadata=section_meta,
                 )
-        section_scores.sort(key=lambda item: item.score, reverse=True)
-        top_sections = section_scores[:top_k]
+            )
         # Expand to individual chunks while preserving hierarchy scores.
         expanded: List[IndexResult] = []
         for section in top_sections:
@@ -124,11 +192,12 @@ class LlamaIndexStub(IndexingStrategy):
             node = self._documents.get(doc_id)
             if node is None:
                 continue
-            section_node = next((s for s in node.sections if s.path == section_path), None)
+            section_node = node.sections.get(tuple(section_path))
             if section_node is None:
                 continue
-            for chunk in section_node.chunks:
-                chunk_score = cosine_similarity(query_vec, embed(chunk))
+            section_node.refresh()
+            for chunk, chunk_vec in zip(section_node.chunks, section_node.chunk_vecs):
+                chunk_score = cosine_similarity(query_vec, chunk_vec)
                 if chunk_score <= 0:
                     continue
                 expanded.append(
@@ -144,3 +213,6 @@ class LlamaIndexStub(IndexingStrategy):
                 )
         expanded.sort(key=lambda item: item.score, reverse=True)
         return expanded[:top_k]
+
+    def search_batch(self, queries: Sequence[str], *, top_k: int = 5) -> List[List[IndexResult]]:
+        return [self.search(query, top_k=top_k) for query in queries]
@@ -1,10 +1,11 @@
 """LLM client abstraction with optional Ollama support."""
 from __future__ import annotations
 
+import json
 import logging
 import os
 from dataclasses import dataclass
-from typing import Iterable, List, Mapping, Optional
+from typing import Iterable, Iterator, List, Mapping, Optional
 
 import requests
 
@@ -12,12 +13,18 @@ DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
 DEFAULT_OLLAMA_MODEL = "llama3.1"
 
 
-@dataclass
+# Prompt lists are cached and shared between calls, so prompts are frozen;
+# slots keep the per-object footprint small for long histories.
+@dataclass(slots=True, frozen=True)
 class LLMPrompt:
     """Container for a prompt block sent to the LLM."""
 
     role: str
     content: str
+    # Marks a block whose content is identical across calls (e.g. a feature's
+    # system template) so providers with prefix/KV caching can reuse it and
+    # only process the varying suffix.
+    cache: bool = False
 
 
 class LLMClient:
@@ -33,6 +40,26 @@ class LLMClient:
     ) -> str:
         raise NotImplementedError
 
+    def generate_stream(
+        self,
+        messages: Iterable[LLMPrompt],
+        *,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+        extra: Optional[Mapping[str, object]] = None,
+    ) -> Iterator[str]:
+        """Yield completion text incrementally.
+
+        Providers without native streaming fall back to a single chunk, so
+        callers can always consume deltas regardless of backend.
+        """
+        yield self.generate(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra=extra,
+        )
+
 
 class StubLLMClient(LLMClient):
     """Fallback LLM client that returns deterministic placeholder text."""
@@ -99,42 +126,70 @@ class OllamaLLMClient(LLMClient):
     ) -> None:
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", DEFAULT_OLLAMA_BASE_URL)
         self.model = model or os.getenv("OLLAMA_MODEL", DEFAULT_OLLAMA_MODEL)
+        # One pooled session for every call so repeated requests reuse the
+        # TCP connection instead of reconnecting per generate.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self._check_server()
 
     def _check_server(self) -> None:
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
             response.raise_for_status()
         except Exception as exc:  # pragma: no cover - environment check
             raise RuntimeError(
                 "Ollama server not reachable. Ensure Ollama is running locally."
             ) from exc
 
-    def generate(
+    def _build_payload(
         self,
         messages: Iterable[LLMPrompt],
         *,
-        temperature: float = 0.2,
-        max_tokens: int = 800,
-        extra: Optional[Mapping[str, object]] = None,
-    ) -> str:
+        temperature: float,
+        max_tokens: int,
+        extra: Optional[Mapping[str, object]],
+        stream: bool,
+    ) -> dict:
+        prompt_list = list(messages)
         payload_messages = [
-            {"role": prompt.role, "content": prompt.content} for prompt in messages
+            {"role": prompt.role, "content": prompt.content} for prompt in prompt_list
         ]
         options = {"temperature": temperature, "num_predict": max_tokens}
+        if any(prompt.cache for prompt in prompt_list):
+            # llama.cpp-backed servers reuse the KV cache for the unchanged
+            # prompt prefix, so repeated system templates are not re-encoded.
+            options.setdefault("cache_prompt", True)
         if extra:
             # Merge supported options from extra, if provided.
             if "options" in extra and isinstance(extra["options"], Mapping):
                 options.update(extra["options"])  # type: ignore[arg-type]
             if "model" in extra:
                 self.model = str(extra["model"])
-        payload = {
+        return {
             "model": self.model,
             "messages": payload_messages,
-            "stream": False,
+            "stream": stream,
             "options": options,
         }
-        response = requests.post(
+
+    def generate(
+        self,
+        messages: Iterable[LLMPrompt],
+        *,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+        extra: Optional[Mapping[str, object]] = None,
+    ) -> str:
+        payload = self._build_payload(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra=extra,
+            stream=False,
+        )
+        response = self._session.post(
             f"{self.base_url}/api/chat",
             json=payload,
             timeout=120,
@@ -144,6 +199,38 @@ class OllamaLLMClient(LLMClient):
         message = data.get("message") or {}
         return message.get("content", "")
 
+    def generate_stream(
+        self,
+        messages: Iterable[LLMPrompt],
+        *,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+        extra: Optional[Mapping[str, object]] = None,
+    ) -> Iterator[str]:
+        payload = self._build_payload(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            extra=extra,
+            stream=True,
+        )
+        response = self._session.post(
+            f"{self.base_url}/api/chat",
+            json=payload,
+            timeout=120,
+            stream=True,
+        )
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            data = json.loads(line)
+            delta = (data.get("message") or {}).get("content", "")
+            if delta:
+                yield delta
+            if data.get("done"):
+                break
+
 
 def get_default_client() -> LLMClient:
     """Return the default LLM client, falling back to the stub client."""
@@ -1,20 +1,29 @@
 """Attachment utilities for session-scoped document management."""
 from __future__ import annotations
 
+import codecs
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import IO, Any, Dict, List, Tuple, Union
 
+Blob = Union[bytes, IO[bytes]]
+
+from ..chunking import get_chunker
 from docx import Document
 
-try:  # PyPDF2 is optional but recommended for PDF ingestion
+try:  # pypdfium2 (C-backed PDFium) is preferred for PDF ingestion
+    import pypdfium2 as pdfium  # type: ignore
+except Exception:  # pragma: no cover - optional dependency guard
+    pdfium = None  # type: ignore
+
+try:  # PyPDF2 remains the pure-Python fallback
     from PyPDF2 import PdfReader  # type: ignore
 except Exception:  # pragma: no cover - optional dependency guard
     PdfReader = None  # type: ignore
 
-@dataclass
+@dataclass(slots=True)
 class Attachment:
     """Representation of a user-supplied reference document."""
 
@@ -27,16 +36,29 @@ class Attachment:
     added_at: datetime
     metadata: Dict[str, Any] = field(default_factory=dict)
     chunks_by_strategy: Dict[str, List[str]] = field(default_factory=dict)
+    # The text never changes after ingestion, so the derived word count and
+    # previews are computed once and reused; as_dict runs per feature call.
+    _word_count: int = field(default=-1, init=False, repr=False)
+    _snippet: str | None = field(default=None, init=False, repr=False)
+    _preview_cache: Dict[int, str] = field(default_factory=dict, init=False, repr=False)
 
     def preview(self, char_limit: int = 240) -> str:
-        snippet = self.text.strip().replace("\r\n", "\n").replace("\r", "\n")
-        if len(snippet) <= char_limit:
-            return snippet
-        return snippet[: char_limit - 1].rstrip() + "…"
+        cached = self._preview_cache.get(char_limit)
+        if cached is not None:
+            return cached
+        if self._snippet is None:
+            self._snippet = self.text.strip().replace("\r\n", "\n").replace("\r", "\n")
+        snippet = self._snippet
+        if len(snippet) > char_limit:
+            snippet = snippet[: char_limit - 1].rstrip() + "…"
+        self._preview_cache[char_limit] = snippet
+        return snippet
 
     @property
     def word_count(self) -> int:
-        return len(self.text.split())
+        if self._word_count < 0:
+            self._word_count = len(self.text.split())
+        return self._word_count
 
     def as_dict(
         self,
@@ -66,20 +88,36 @@ class Attachment:
         return data
 
     def get_chunks(self, strategy: str | None = None) -> List[str]:
-        if strategy and strategy in self.chunks_by_strategy:
-            return self.chunks_by_strategy[strategy]
+        if strategy:
+            cached = self.chunks_by_strategy.get(strategy)
+            if cached is not None:
+                return cached
+            # Strategies are chunked lazily on first access rather than all
+            # eagerly at upload; unknown strategies keep the default chunks.
+            try:
+                chunker = get_chunker(strategy)
+            except ValueError:
+                return self.chunks
+            chunks = chunker.chunk(self.text)
+            self.chunks_by_strategy[strategy] = chunks
+            return chunks
         return self.chunks
 
 
 def extract_text_from_attachment(
     filename: str,
     content_type: str,
-    blob: bytes,
+    blob: Blob,
 ) -> Tuple[str, Dict[str, Any]]:
-    """Return plain text content and metadata extracted from an uploaded file."""
+    """Return plain text content and metadata extracted from an uploaded file.
+
+    *blob* may be raw bytes or a readable binary stream (e.g. the spooled
+    temporary file behind an upload); streams are consumed without first
+    materializing the whole payload in memory.
+    """
     suffix = Path(filename).suffix.lower()
     extractor = _select_extractor(suffix, content_type)
-    text = extractor(blob)
+    text = extractor(_ensure_stream(blob))
     metadata = {
         "source_extension": suffix.lstrip("."),
         "content_type": content_type,
@@ -87,6 +125,24 @@ def extract_text_from_attachment(
     return text, metadata
 
 
+def blob_size(blob: Blob) -> int:
+    """Return the byte size of raw bytes or a seekable binary stream."""
+    if isinstance(blob, (bytes, bytearray)):
+        return len(blob)
+    position = blob.tell()
+    blob.seek(0, 2)
+    size = blob.tell()
+    blob.seek(position)
+    return size
+
+
+def _ensure_stream(blob: Blob) -> IO[bytes]:
+    if isinstance(blob, (bytes, bytearray)):
+        return BytesIO(blob)
+    blob.seek(0)
+    return blob
+
+
 def _select_extractor(suffix: str, content_type: str):
     if suffix in {".txt", ".md", ".markdown"} or content_type.startswith("text/"):
         return _extract_text_plain
@@ -97,22 +153,43 @@ def _select_extractor(suffix: str, content_type: str):
     return _extract_text_fallback
 
 
-def _extract_text_plain(blob: bytes) -> str:
-    return blob.decode("utf-8", errors="replace")
+def _extract_text_plain(stream: IO[bytes]) -> str:
+    # Incremental decode so split multi-byte sequences at chunk boundaries
+    # are handled correctly without reading the whole stream at once.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    fragments: List[str] = []
+    while chunk := stream.read(65536):
+        fragments.append(decoder.decode(chunk))
+    fragments.append(decoder.decode(b"", final=True))
+    return "".join(fragments)
 
 
-def _extract_text_docx(blob: bytes) -> str:
-    document = Document(BytesIO(blob))
+def _extract_text_docx(stream: IO[bytes]) -> str:
+    document = Document(stream)
     paragraphs = [para.text for para in document.paragraphs if para.text]
     return "\n".join(paragraphs)
 
 
-def _extract_text_pdf(blob: bytes) -> str:
+def _extract_text_pdf(stream: IO[bytes]) -> str:
+    if pdfium is not None:
+        # PDFium parses content streams in C (and releases the GIL), which is
+        # typically several times faster than PyPDF2 on multi-page files.
+        document = pdfium.PdfDocument(stream)
+        try:
+            fragments = []
+            for page in document:
+                text = page.get_textpage().get_text_range()
+                if text:
+                    fragments.append(text)
+            return "\n".join(fragments)
+        finally:
+            document.close()
     if PdfReader is None:  # pragma: no cover - optional dependency guard
         raise RuntimeError(
-            "PyPDF2 is required to read PDF attachments. Install it via `pip install PyPDF2`."
+            "A PDF backend is required to read PDF attachments. Install one via "
+            "`pip install pypdfium2` (preferred) or `pip install PyPDF2`."
         )
-    reader = PdfReader(BytesIO(blob))
+    reader = PdfReader(stream)
     fragments: List[str] = []
     for page in reader.pages:
         text = page.extract_text() or ""
@@ -121,8 +198,8 @@ def _extract_text_pdf(blob: bytes) -> str:
     return "\n".join(fragments)
 
 
-def _extract_text_fallback(blob: bytes) -> str:
+def _extract_text_fallback(stream: IO[bytes]) -> str:
     try:
-        return blob.decode("utf-8", errors="replace")
+        return _extract_text_plain(stream)
     except Exception:  # pragma: no cover - defensive fallback
         return ""
\ No newline at end of file
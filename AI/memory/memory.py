@@ -1,13 +1,22 @@
 """Conversation memory store for the assistant."""
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Iterable, List, Literal, Sequence
+from typing import Deque, Iterable, List, Literal, Sequence, Tuple
+
+from ..llm import LLMPrompt
 
 Role = Literal["system", "user", "assistant", "feature"]
 
+# Internal "feature" messages surface as assistant turns in LLM contexts; a
+# dict lookup per message replaces the conditional in the hot comprehensions.
+_ROLE_MAP = {"feature": "assistant"}
+
 
-@dataclass
+# slots=True drops the per-instance __dict__; messages are allocated every
+# turn and retained for the session's lifetime, so the saving accumulates.
+@dataclass(slots=True)
 class Message:
     """Single conversational message."""
 
@@ -19,14 +28,28 @@ class Message:
         return {"role": self.role, "content": self.content, "feature": self.feature}
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationMemory:
     """In-memory rolling log of the conversation for a session."""
 
-    messages: List[Message] = field(default_factory=list)
+    # Messages are backed by a deque so an optional maxlen bounds the log:
+    # appends past the cap drop the oldest entry in O(1) instead of relying
+    # on callers to truncate (which copied the whole list each time).
+    messages: Deque[Message] = field(default_factory=deque)
+    max_messages: int | None = None
+    # Version counter plus cached prompt tuple, mirroring the session-state
+    # snapshot pattern: the prompt list is rebuilt only after the log changes.
+    _version: int = field(default=0, init=False, repr=False)
+    _prompt_cache: Tuple[LLMPrompt, ...] = field(default=(), init=False, repr=False)
+    _prompt_cache_version: int = field(default=-1, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.messages, deque) or self.messages.maxlen != self.max_messages:
+            self.messages = deque(self.messages, maxlen=self.max_messages)
 
     def append(self, role: Role, content: str, *, feature: str | None = None) -> None:
         self.messages.append(Message(role=role, content=content, feature=feature))
+        self._version += 1
 
     def last(self) -> Message | None:
         if not self.messages:
@@ -35,6 +58,7 @@ class ConversationMemory:
 
     def extend(self, entries: Iterable[Message]) -> None:
         self.messages.extend(entries)
+        self._version += 1
 
     def as_list(self) -> List[dict]:
         return [msg.as_dict() for msg in self.messages]
@@ -46,13 +70,30 @@ class ConversationMemory:
         """Trim the log to the newest *max_messages* messages."""
         if max_messages <= 0:
             self.messages.clear()
+            self._version += 1
             return
         if len(self.messages) > max_messages:
-            self.messages = self.messages[-max_messages:]
+            # Rebinding through a bounded deque keeps only the newest entries
+            # without slicing a copy of the survivors first.
+            self.messages = deque(self.messages, maxlen=max_messages)
+            self._version += 1
 
     def as_context(self) -> Sequence[dict]:
         """Return an OpenAI-style list of messages."""
         return [
-            {"role": msg.role if msg.role != "feature" else "assistant", "content": msg.content}
+            {"role": _ROLE_MAP.get(msg.role, msg.role), "content": msg.content}
             for msg in self.messages
         ]
+
+    def as_prompt_list(self) -> Tuple[LLMPrompt, ...]:
+        """Return the conversation as LLM prompts, cached until the log changes."""
+        if self._prompt_cache_version != self._version:
+            self._prompt_cache = tuple(
+                LLMPrompt(
+                    role=_ROLE_MAP.get(msg.role, msg.role),
+                    content=msg.content,
+                )
+                for msg in self.messages
+            )
+            self._prompt_cache_version = self._version
+        return self._prompt_cache
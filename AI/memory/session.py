@@ -3,8 +3,13 @@ from __future__ import annotations
 
 import secrets
 from dataclasses import dataclass, field
+from sys import intern
+from operator import itemgetter
+from threading import Lock
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from ..chunking import available_chunkers, get_chunker
 from ..chunking.sections import detect_section_heading
@@ -12,11 +17,12 @@ from ..evaluation import (mean_reciprocal_rank, ndcg_at_k, precision_at_k,
                           recall_at_k, summarise_latency)
 from ..indexing import available_indexers, get_indexer
 from ..indexing.base import IndexingStrategy, IndexResult
-from .attachments import Attachment, extract_text_from_attachment
+from .attachments import (Attachment, Blob, blob_size,
+                          extract_text_from_attachment)
 from .memory import ConversationMemory
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Per-user conversational session."""
 
@@ -27,6 +33,14 @@ class Session:
     chunking_strategy: str = "fixed"
     indexing_strategy: str = "none"
     _index: IndexingStrategy = field(init=False, repr=False)
+    _state_snapshot: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _state_version: int = field(default=0, init=False, repr=False)
+    # Attachment-set version plus cached digests keyed by (strategy, limit);
+    # repeated digest lookups between mutations (every chat turn) are O(1).
+    _attachments_version: int = field(default=0, init=False, repr=False)
+    _digest_cache: Dict[Tuple[str, int], Tuple[int, str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         self._index = get_indexer(self.indexing_strategy)
@@ -35,7 +49,25 @@ class Session:
         self._refresh_attachment_state()
 
     def set_state(self, key: str, value: Any) -> None:
+        # Stores the value by reference — no copy or serialization. Callers
+        # own request-scoped values (e.g. chat metadata), so aliasing is safe
+        # and readers see a consistent view via state_snapshot().
         self.state[key] = value
+        self._invalidate_state_snapshot()
+
+    def _invalidate_state_snapshot(self) -> None:
+        self._state_snapshot = None
+        self._state_version += 1
+
+    def state_snapshot(self) -> Dict[str, Any]:
+        """Cached copy of the state dict, rebuilt only after a mutation.
+
+        The returned dict is shared between callers and must be treated as
+        read-only (it is only ever serialized into responses).
+        """
+        if self._state_snapshot is None:
+            self._state_snapshot = dict(self.state)
+        return self._state_snapshot
 
     def get_state(self, key: str, default: Any | None = None) -> Any:
         return self.state.get(key, default)
@@ -45,22 +77,22 @@ class Session:
         *,
         filename: str,
         content_type: str,
-        data: bytes,
+        data: Blob,
     ) -> Attachment:
         attachment_id = secrets.token_hex(8)
+        size = blob_size(data)
         text, metadata = extract_text_from_attachment(filename, content_type, data)
-        chunk_map: Dict[str, List[str]] = {}
-        for strategy_name in available_chunkers():
-            chunker = get_chunker(strategy_name)
-            chunk_map[strategy_name] = chunker.chunk(text)
-        selected_chunks = chunk_map.get(self.chunking_strategy)
-        if selected_chunks is None:
-            selected_chunks = chunk_map.get("fixed", [])
+        # Only the active strategy is chunked at upload; other strategies are
+        # chunked lazily by Attachment.get_chunks when first requested. The
+        # chunkers are pure-Python and CPU-bound, so skipping the unused
+        # strategies outright beats fanning them out across threads.
+        selected_chunks = get_chunker(self.chunking_strategy).chunk(text)
+        chunk_map: Dict[str, List[str]] = {self.chunking_strategy: selected_chunks}
         attachment = Attachment(
             attachment_id=attachment_id,
             filename=filename,
             content_type=content_type or "application/octet-stream",
-            size=len(data),
+            size=size,
             text=text,
             chunks=selected_chunks,
             added_at=datetime.now(timezone.utc),
@@ -69,7 +101,13 @@ class Session:
         )
         self.attachments[attachment_id] = attachment
         self._refresh_attachment_state()
-        self._rebuild_index()
+        # Only the new attachment's chunks are added; existing attachments
+        # are already indexed and indexers ingest incrementally.
+        documents, metadata = self._attachment_documents(attachment)
+        if documents:
+            self._index.add_documents(documents, metadata=metadata)
+        self.state["index_size"] = self.state.get("index_size", 0) + len(documents)
+        self._invalidate_state_snapshot()
         return attachment
 
     def remove_attachment(self, attachment_id: str) -> bool:
@@ -77,7 +115,9 @@ class Session:
         if removed is None:
             return False
         self._refresh_attachment_state()
-        self._rebuild_index()
+        dropped = self._index.remove_by_document_id(attachment_id)
+        self.state["index_size"] = max(self.state.get("index_size", 0) - dropped, 0)
+        self._invalidate_state_snapshot()
         return True
 
     def list_attachments(self) -> List[Attachment]:
@@ -100,48 +140,79 @@ class Session:
     def attachment_digest(self, *, char_limit: int = 2000) -> str:
         if not self.attachments:
             return ""
+        cache_key = (self.chunking_strategy, char_limit)
+        cached = self._digest_cache.get(cache_key)
+        if cached is not None and cached[0] == self._attachments_version:
+            return cached[1]
         pieces: List[str] = []
         remaining = char_limit
+        strategy = self.chunking_strategy
         for attachment in self.attachments.values():
+            # The separator is counted against the budget too, so attachments
+            # whose entries would be sliced off entirely by the final cap are
+            # never previewed or chunk-counted at all.
+            if pieces:
+                remaining -= 2
             if remaining <= 0:
                 break
             preview = attachment.preview(min(remaining, 320))
-            chunk_count = len(attachment.get_chunks(self.chunking_strategy))
+            chunk_count = len(attachment.get_chunks(strategy))
             entry = (
                 f"{attachment.filename} (chunks: {chunk_count}, added {attachment.added_at.date()}):\n"
                 f"{preview}"
             )
             pieces.append(entry)
             remaining -= len(entry)
-        return "\n\n".join(pieces)[:char_limit]
+        digest = "\n\n".join(pieces)[:char_limit]
+        self._digest_cache[cache_key] = (self._attachments_version, digest)
+        return digest
 
     def _refresh_attachment_state(self) -> None:
+        # Runs only on attachment mutations, so the summary list is already
+        # rebuilt at most once per add/remove/strategy change; the version
+        # bump invalidates the stale digest cache entries.
+        self._attachments_version += 1
         summary = [attachment.as_dict(preview_chars=160) for attachment in self.attachments.values()]
         self.state["attachments"] = summary
         self.state["chunking_strategy"] = self.chunking_strategy
         self.state["indexing_strategy"] = self.indexing_strategy
+        self._invalidate_state_snapshot()
+
+    def _attachment_documents(self, attachment: Attachment) -> tuple[List[str], List[dict]]:
+        chunks = attachment.get_chunks(self.chunking_strategy)
+        # The documents list is one bulk copy; only the metadata loop remains
+        # per-chunk because each section context chains off the previous one.
+        documents = list(chunks)
+        metadata: List[dict] = []
+        append_meta = metadata.append
+        derive_context = _derive_section_context
+        build_metadata = _build_chunk_metadata
+        section_context: Optional[dict] = None
+        for idx, chunk in enumerate(chunks):
+            section_context = derive_context(chunk, section_context)
+            append_meta(
+                build_metadata(
+                    attachment=attachment,
+                    chunk_index=idx,
+                    context=section_context,
+                )
+            )
+        return documents, metadata
 
     def _rebuild_index(self) -> None:
-        self._index = get_indexer(self.indexing_strategy)
+        # The indexer instance is kept across rebuilds (reset() empties it in
+        # place); a fresh instance is only created when the strategy changes.
         self._index.reset()
         documents: List[str] = []
         metadata: List[dict] = []
         for attachment in self.attachments.values():
-            chunks = attachment.get_chunks(self.chunking_strategy)
-            section_context: Optional[dict] = None
-            for idx, chunk in enumerate(chunks):
-                documents.append(chunk)
-                section_context = _derive_section_context(chunk, section_context)
-                metadata.append(
-                    _build_chunk_metadata(
-                        attachment=attachment,
-                        chunk_index=idx,
-                        context=section_context,
-                    )
-                )
+            attachment_docs, attachment_meta = self._attachment_documents(attachment)
+            documents.extend(attachment_docs)
+            metadata.extend(attachment_meta)
         if documents:
             self._index.add_documents(documents, metadata=metadata)
         self.state["index_size"] = len(documents)
+        self._invalidate_state_snapshot()
 
     def set_chunking_strategy(self, strategy: str) -> None:
         if strategy == self.chunking_strategy:
@@ -150,9 +221,6 @@ class Session:
             raise ValueError(f"Unsupported chunking strategy '{strategy}'")
         self.chunking_strategy = strategy
         for attachment in self.attachments.values():
-            if strategy not in attachment.chunks_by_strategy:
-                chunker = get_chunker(strategy)
-                attachment.chunks_by_strategy[strategy] = chunker.chunk(attachment.text)
             attachment.chunks = attachment.get_chunks(strategy)
         self._refresh_attachment_state()
         self._rebuild_index()
@@ -163,6 +231,7 @@ class Session:
         if strategy not in available_indexers():
             raise ValueError(f"Unsupported indexing strategy '{strategy}'")
         self.indexing_strategy = strategy
+        self._index = get_indexer(strategy)
         self._rebuild_index()
 
     def search(self, query: str, *, top_k: int = 5) -> List[IndexResult]:
@@ -176,10 +245,12 @@ class Session:
         for result in raw_results:
             meta = result.metadata or {}
             rank = meta.get("section_rank") or meta.get("section") or "General"
+            score = result.score
+            section_score = meta.get("section_score", score)
             bucket = buckets.get(rank)
-            section_heading = meta.get("section_heading") or meta.get("section") or "General"
             if bucket is None:
-                bucket = {
+                section_heading = meta.get("section_heading") or meta.get("section") or "General"
+                bucket = buckets[rank] = {
                     "section_rank": rank,
                     "section_heading": section_heading,
                     "section_title": meta.get("section_title") or section_heading,
@@ -188,18 +259,19 @@ class Session:
                     "document_id": meta.get("document_id"),
                     "document_label": meta.get("document_label") or meta.get("filename"),
                     "best_chunk": result.chunk,
-                    "best_chunk_score": result.score,
-                    "score": meta.get("section_score", result.score),
+                    "best_chunk_score": score,
+                    "score": section_score,
                     "chunk_count": meta.get("chunk_count"),
-                    "matches": 0,
+                    "matches": 1,
                 }
-                buckets[rank] = bucket
+                continue
             bucket["matches"] += 1
-            bucket["score"] = max(bucket["score"], meta.get("section_score", result.score))
-            if result.score > bucket["best_chunk_score"]:
-                bucket["best_chunk_score"] = result.score
+            if section_score > bucket["score"]:
+                bucket["score"] = section_score
+            if score > bucket["best_chunk_score"]:
+                bucket["best_chunk_score"] = score
                 bucket["best_chunk"] = result.chunk
-        ordered = sorted(buckets.values(), key=lambda item: item["score"], reverse=True)
+        ordered = sorted(buckets.values(), key=itemgetter("score"), reverse=True)
         return ordered[:top_k]
 
     def evaluate_retrieval(
@@ -220,29 +292,57 @@ class Session:
                 "per_query": [],
                 "efficiency": None,
             }
-        aggregate_precision: List[float] = []
-        aggregate_recall: List[float] = []
-        aggregate_mrr: List[float] = []
-        aggregate_ndcg: List[float] = []
+        # One (queries x 4) row per query; the final means are then a single
+        # vectorised reduction instead of four Python list sums.
+        metric_rows: List[Tuple[float, float, float, float]] = []
         per_query_results: List[Dict[str, Any]] = []
 
+        valid: List[Tuple[str, List[str], int]] = []
         for entry in queries:
             query_text = entry.get("query", "").strip()
             if not query_text:
                 continue
-            relevant_chunks: List[str] = entry.get("relevant_chunks", [])
-            top_k = int(entry.get("top_k") or default_top_k)
-            results = self.search(query_text, top_k=top_k)
+            valid.append(
+                (
+                    query_text,
+                    entry.get("relevant_chunks", []),
+                    int(entry.get("top_k") or default_top_k),
+                )
+            )
+        # Queries sharing a top_k are dispatched through search_batch in one
+        # call, so batching-aware indexers score them as a single matrix
+        # product instead of one matvec per query.
+        batch_results: Dict[int, List[IndexResult]] = {}
+        by_top_k: Dict[int, List[int]] = {}
+        for pos, (_, _, top_k) in enumerate(valid):
+            by_top_k.setdefault(top_k, []).append(pos)
+        for top_k, positions in by_top_k.items():
+            batch = self._index.search_batch(
+                [valid[pos][0] for pos in positions], top_k=top_k
+            )
+            for pos, results in zip(positions, batch):
+                batch_results[pos] = results
+
+        # Chunks recur across queries (they come from the same index), so each
+        # one is lowercased at most once per evaluation run.
+        lower_memo: Dict[str, str] = {}
+        for pos, (query_text, relevant_chunks, top_k) in enumerate(valid):
+            results = batch_results[pos]
             retrieved = [result.chunk for result in results]
-            relevance_flags = _compute_relevance_flags(retrieved, relevant_chunks)
+            retrieved_lower = []
+            for chunk in retrieved:
+                chunk_lower = lower_memo.get(chunk)
+                if chunk_lower is None:
+                    chunk_lower = lower_memo[chunk] = chunk.lower()
+                retrieved_lower.append(chunk_lower)
+            relevance_flags = _compute_relevance_flags(
+                retrieved, relevant_chunks, retrieved_lower=retrieved_lower
+            )
             precision = precision_at_k(relevance_flags, top_k)
             recall = recall_at_k(relevance_flags, len(relevant_chunks), top_k)
             mrr = mean_reciprocal_rank(relevance_flags)
             ndcg = ndcg_at_k(relevance_flags, top_k)
-            aggregate_precision.append(precision)
-            aggregate_recall.append(recall)
-            aggregate_mrr.append(mrr)
-            aggregate_ndcg.append(ndcg)
+            metric_rows.append((precision, recall, mrr, ndcg))
             per_query_results.append(
                 {
                     "query": query_text,
@@ -266,51 +366,69 @@ class Session:
             if throughput_qps is not None:
                 efficiency["throughput_qps"] = throughput_qps
 
-        count = len(per_query_results) or 1
+        if metric_rows:
+            means = np.asarray(metric_rows, dtype=np.float64).mean(axis=0)
+        else:
+            means = np.zeros(4)
         return {
-            "precision_at_k": sum(aggregate_precision) / count,
-            "recall_at_k": sum(aggregate_recall) / count,
-            "mrr": sum(aggregate_mrr) / count,
-            "ndcg_at_k": sum(aggregate_ndcg) / count,
+            "precision_at_k": float(means[0]),
+            "recall_at_k": float(means[1]),
+            "mrr": float(means[2]),
+            "ndcg_at_k": float(means[3]),
             "per_query": per_query_results,
             "efficiency": efficiency,
         }
 
 
 class SessionManager:
-    """Simple in-memory session manager."""
+    """Simple in-memory session manager.
+
+    Lookups are lock-free: readers resolve against a published snapshot dict
+    that writers replace wholesale under a lock (copy-on-write), so the
+    per-request get_session path never serializes on a mutex.
+    """
 
     def __init__(self) -> None:
+        self._write_lock = Lock()
         self._sessions: Dict[str, Session] = {}
 
     def create_session(self) -> Session:
         session_id = secrets.token_hex(16)
         session = Session(session_id=session_id)
-        self._sessions[session_id] = session
+        with self._write_lock:
+            self._sessions = {**self._sessions, session_id: session}
         return session
 
     def get_session(self, session_id: str) -> Session:
-        if session_id not in self._sessions:
+        session = self._sessions.get(session_id)
+        if session is None:
             raise KeyError(f"Session {session_id} not found")
-        return self._sessions[session_id]
+        return session
 
     def delete_session(self, session_id: str) -> None:
-        self._sessions.pop(session_id, None)
+        with self._write_lock:
+            if session_id in self._sessions:
+                updated = dict(self._sessions)
+                del updated[session_id]
+                self._sessions = updated
 
     def clear(self) -> None:
-        self._sessions.clear()
+        with self._write_lock:
+            self._sessions = {}
 
 
 def _derive_section_context(chunk: str, previous: Optional[dict]) -> dict:
     heading = detect_section_heading(chunk or "")
     if heading:
-        heading_text = heading.get("heading") or heading.get("title") or "General"
-        title = heading.get("title") or heading_text
+        # Section labels repeat across every chunk under the same heading;
+        # interning them shares one string object across all metadata dicts.
+        heading_text = intern(heading.get("heading") or heading.get("title") or "General")
+        title = intern(heading.get("title") or heading_text)
         identifier = heading.get("identifier")
-        path = list(heading.get("path") or [])
+        path = [intern(str(part)) for part in heading.get("path") or []]
         if not path:
             path = [title]
-        rank = " > ".join(path) if path else heading_text
+        rank = intern(" > ".join(path)) if path else heading_text
         return {
             "heading": heading_text,
             "title": title,
@@ -345,7 +463,7 @@ def _build_chunk_metadata(*, attachment: Attachment, chunk_index: int, context:
         label_parts.append(str(identifier))
     if title:
         label_parts.append(str(title))
-    label = " ".join(label_parts).strip() or context.get("heading", "General")
+    label = intern(" ".join(label_parts).strip() or context.get("heading", "General"))
     metadata = {
         "attachment_id": attachment.attachment_id,
         "chunk_index": chunk_index,
@@ -368,14 +486,24 @@ def _build_chunk_metadata(*, attachment: Attachment, chunk_index: int, context:
     return metadata
 
 
-def _compute_relevance_flags(retrieved: Sequence[str], relevant: Sequence[str]) -> List[int]:
+def _compute_relevance_flags(
+    retrieved: Sequence[str],
+    relevant: Sequence[str],
+    *,
+    retrieved_lower: Optional[Sequence[str]] = None,
+) -> List[int]:
     if not retrieved:
         return []
-    if not relevant:
+    # Patterns are lowered once up front instead of once per (chunk, pattern)
+    # pair; each chunk is then a single pass of C-level substring checks.
+    # Callers that already hold lowercased chunks pass them via
+    # retrieved_lower to skip re-lowering here.
+    patterns = [rel.lower() for rel in relevant if rel]
+    if not patterns:
         return [0 for _ in retrieved]
+    if retrieved_lower is None:
+        retrieved_lower = [chunk.lower() for chunk in retrieved]
     flags: List[int] = []
-    for chunk in retrieved:
-        chunk_lower = chunk.lower()
-        match = any(rel.lower() in chunk_lower for rel in relevant if rel)
-        flags.append(1 if match else 0)
+    for chunk_lower in retrieved_lower:
+        flags.append(1 if any(pattern in chunk_lower for pattern in patterns) else 0)
     return flags
@@ -1,8 +1,9 @@
 """Generate BA reports using the provided DOCX template."""
 from __future__ import annotations
 
+from io import BytesIO
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import Dict, Iterable, Mapping
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -15,9 +16,23 @@ from ..memory import Session
 class BAReportGenerator:
     """Render a structured report aligned with the VinUni CECS capstone template."""
 
+    # Cached at class level because callers build a fresh generator per
+    # report; each template file is read from disk once per process.
+    _template_cache: Dict[Path, bytes] = {}
+
     def __init__(self, template_path: Path | None = None) -> None:
         self.template_path = template_path or get_template_path()
 
+    def refresh_template(self) -> None:
+        """Drop the cached template bytes so the next report re-reads disk."""
+        self._template_cache.pop(self.template_path, None)
+
+    def _open_template(self) -> BytesIO:
+        data = self._template_cache.get(self.template_path)
+        if data is None:
+            data = self._template_cache[self.template_path] = self.template_path.read_bytes()
+        return BytesIO(data)
+
     def generate(self, session: Session, output_path: Path | None = None) -> Path:
         """Create the report populated with the session artefacts."""
         if output_path is None:
@@ -30,7 +45,7 @@ class BAReportGenerator:
             else:
                 output_dir = Path(output_dir)
             output_path = output_dir / f"BA_Report_{session.session_id}.docx"
-        document = Document(str(self.template_path))
+        document = Document(self._open_template())
         self._apply_heading_style(document)
         self._populate_document(document, session)
         document.save(str(output_path))
@@ -183,11 +198,11 @@ class BAReportGenerator:
             add_paragraph("No supporting documents attached.")
 
         add_heading("Conversation Log", level=1)
-        messages = session.memory.as_list()
-        for message in messages:
-            role = message.get("feature") or message.get("role")
-            content = message.get("content", "")
-            para = add_paragraph(f"[{role}] {content}")
+        # Iterate the messages directly; as_list() would allocate a dict per
+        # message just to read three fields back out.
+        for message in session.memory.messages:
+            role = message.feature or message.role
+            para = add_paragraph(f"[{role}] {message.content}")
             para.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
     def _add_numbered_list(
@@ -3,9 +3,14 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+# Output-only models are frozen with extras forbidden: pydantic-core lays out
+# a tighter validator for them and accidental post-construction mutation or
+# typo'd kwargs fail loudly.
+_OUTPUT_CONFIG = ConfigDict(frozen=True, extra="forbid")
 
 
 class FeatureName(str, Enum):
@@ -17,17 +22,35 @@ class FeatureName(str, Enum):
     ba_report_export = "ba_report_export"
 
 
+# One dict hit resolves the six known feature keys (and already-coerced
+# members) on the hot chat ingress; anything else falls through unchanged to
+# the regular enum validator, which produces the usual 422 detail.
+_FEATURE_LOOKUP: Dict[Any, FeatureName] = {member.value: member for member in FeatureName}
+_FEATURE_LOOKUP.update({member: member for member in FeatureName})
+
+
+def _coerce_feature(value: Any) -> Any:
+    try:
+        return _FEATURE_LOOKUP.get(value, value)
+    except TypeError:  # unhashable payloads go to the enum validator as-is
+        return value
+
+
 class SessionCreateResponse(BaseModel):
     session_id: str = Field(..., description="Identifier for the newly created session")
 
 
 class ChatRequest(BaseModel):
-    feature: FeatureName = Field(..., description="Feature to engage")
+    feature: Annotated[FeatureName, BeforeValidator(_coerce_feature)] = Field(
+        ..., description="Feature to engage"
+    )
     message: str = Field(..., description="User message or task prompt")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Optional metadata")
 
 
 class FeatureDescriptor(BaseModel):
+    model_config = _OUTPUT_CONFIG
+
     key: FeatureName
     description: str
 
@@ -37,6 +60,11 @@ class FeatureListResponse(BaseModel):
 
 
 class ChatResponse(BaseModel):
+    model_config = _OUTPUT_CONFIG
+
+    # data carries whatever JSON the LLM produced for the feature, so it
+    # stays untyped; the chat route encodes the payload straight with orjson,
+    # so no Any-walking serializer runs on it either way.
     feature: FeatureName
     title: str
     summary: str
@@ -44,8 +72,16 @@ class ChatResponse(BaseModel):
     session_state: Dict[str, Any]
 
 
+class ChatMessage(BaseModel):
+    # Typed fields let pydantic-core serialize the transcript with its
+    # specialized str/literal serializers instead of the Any-dict walker.
+    role: Literal["system", "user", "assistant", "feature"]
+    content: str
+    feature: Optional[str] = None
+
+
 class TranscriptResponse(BaseModel):
-    messages: List[Dict[str, Any]]
+    messages: List[ChatMessage]
 
 
 class ErrorResponse(BaseModel):
@@ -53,6 +89,10 @@ class ErrorResponse(BaseModel):
 
 
 class AttachmentMetadata(BaseModel):
+    # Frozen like the other output models, but extras stay ignored: the model
+    # is fed Attachment.as_dict(), which carries chunk_counts we drop here.
+    model_config = ConfigDict(frozen=True)
+
     attachment_id: str
     filename: str
     content_type: str
@@ -72,6 +112,8 @@ class AttachmentUploadResponse(BaseModel):
 
 
 class StrategyDescriptor(BaseModel):
+    model_config = _OUTPUT_CONFIG
+
     key: str
     name: str
     description: str
@@ -96,6 +138,8 @@ class SearchRequest(BaseModel):
 
 
 class SearchResult(BaseModel):
+    model_config = _OUTPUT_CONFIG
+
     chunk: str
     score: float
     metadata: Optional[Dict[str, Any]]
@@ -119,6 +163,8 @@ class EvaluationRequest(BaseModel):
 
 
 class EvaluationPerQueryResult(BaseModel):
+    model_config = _OUTPUT_CONFIG
+
     query: str
     top_k: int
     precision_at_k: float
@@ -11,18 +11,29 @@ Optionally load a scripted conversation by passing ``--script path/to/turns.json
 from __future__ import annotations
 
 import argparse
-import json
-import mimetypes
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Iterator, List, Sequence
+from typing import TYPE_CHECKING, Iterator, List, Sequence
+
+import orjson
 
 from .chunking import available_chunkers
-from .features import FeatureContext, build_default_registry
 from .indexing import available_indexers
-from .llm import get_default_client
-from .memory import Session, SessionManager
 
-SUPPORTED_EXTENSIONS = {".txt", ".md", ".markdown", ".docx", ".pdf"}
+if TYPE_CHECKING:  # the heavy packages are imported lazily in main()
+    from .memory import Session
+
+# The supported formats are a closed set, so content types come from this
+# table instead of mimetypes.guess_type parsing the system MIME maps.
+_CONTENT_TYPES = {
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+    ".markdown": "text/markdown",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".pdf": "application/pdf",
+}
+SUPPORTED_EXTENSIONS = set(_CONTENT_TYPES)
 
 
 def parse_args() -> argparse.Namespace:
@@ -65,6 +76,13 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
+    # Deferring these imports keeps --help and argument errors fast: the
+    # feature, LLM, and memory stacks (pydantic, requests, python-docx)
+    # only load once a real run starts.
+    from .features import FeatureContext, build_default_registry
+    from .llm import get_default_client
+    from .memory import SessionManager
+
     manager = SessionManager()
     session = manager.create_session()
     if args.chunking:
@@ -74,6 +92,10 @@ def main() -> None:
 
     llm = get_default_client()
     registry = build_default_registry()
+    # The session and client live for the whole run, so every feature is
+    # instantiated once up front instead of once per turn.
+    context = FeatureContext(session=session, llm=llm)
+    features = {key: registry.create(key, context) for key in registry.keys()}
 
     if args.attachments:
         loaded = _attach_files(session, args.attachments)
@@ -86,53 +108,77 @@ def main() -> None:
 
     if args.script:
         turns = _load_scripted_turns(args.script)
-        _run_scripted_turns(session, registry, llm, turns)
+        _run_scripted_turns(session, features, turns)
     else:
-        _interactive_loop(session, registry, llm)
+        _interactive_loop(session, features)
 
 
 def _attach_files(session: Session, inputs: Sequence[Path]) -> List[Path]:
     files = list(_discover_files(inputs))
     loaded: List[Path] = []
-    for path in files:
-        try:
-            data = path.read_bytes()
-        except OSError as exc:
-            print(f"[warn] Cannot read {path}: {exc}")
-            continue
-        content_type, _ = mimetypes.guess_type(path.name)
-        if content_type is None:
-            content_type = "application/octet-stream"
-        try:
-            session.add_attachment(
-                filename=path.name,
-                content_type=content_type,
-                data=data,
+    if not files:
+        return loaded
+    # Disk reads overlap in a small thread pool; attachments are still added
+    # one at a time because add_attachment mutates the session index.
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+        futures = [(path, pool.submit(path.read_bytes)) for path in files]
+        for path, future in futures:
+            try:
+                data = future.result()
+            except OSError as exc:
+                print(f"[warn] Cannot read {path}: {exc}")
+                continue
+            content_type = _CONTENT_TYPES.get(
+                path.suffix.lower(), "application/octet-stream"
             )
-        except Exception as exc:  # pragma: no cover - defensive during manual runs
-            print(f"[warn] Failed to attach {path.name}: {exc}")
-            continue
-        loaded.append(path)
+            try:
+                session.add_attachment(
+                    filename=path.name,
+                    content_type=content_type,
+                    data=data,
+                )
+            except Exception as exc:  # pragma: no cover - defensive during manual runs
+                print(f"[warn] Failed to attach {path.name}: {exc}")
+                continue
+            loaded.append(path)
     return loaded
 
 
 def _discover_files(inputs: Sequence[Path]) -> Iterator[Path]:
     for entry in inputs:
         if entry.is_dir():
-            for candidate in sorted(entry.rglob("*")):
-                if candidate.is_file() and candidate.suffix.lower() in SUPPORTED_EXTENSIONS:
-                    yield candidate
+            yield from _walk_supported(str(entry))
         elif entry.is_file() and entry.suffix.lower() in SUPPORTED_EXTENSIONS:
             yield entry
 
 
+def _walk_supported(root: str) -> Iterator[Path]:
+    # scandir-based recursion keeps memory bounded to one directory at a
+    # time and reuses the DirEntry type information instead of re-statting
+    # every path the way sorted(rglob("*")) + is_file() did.
+    try:
+        entries = sorted(os.scandir(root), key=lambda item: item.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_supported(entry.path)
+        elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+            yield Path(entry.path)
+
+
 def _load_scripted_turns(path: Path) -> List[dict]:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
+        # orjson decodes the raw bytes directly, skipping the separate
+        # text-decoding pass of read_text + stdlib json.
+        payload = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as exc:
         raise SystemExit(f"Unable to read scripted turns: {exc}") from exc
-    raw_turns = payload.get("turns", payload)
-    if not isinstance(raw_turns, Iterable):
+    raw_turns = payload.get("turns", payload) if isinstance(payload, dict) else payload
+    # JSON only ever decodes to list/dict at this level, so a direct type
+    # check beats the Iterable ABC subclass hook (which a dict would pass
+    # despite not being a list of turns).
+    if not isinstance(raw_turns, (list, tuple)):
         raise SystemExit("Script format must be a list or an object with a 'turns' list.")
     turns: List[dict] = []
     for item in raw_turns:
@@ -150,13 +196,17 @@ def _load_scripted_turns(path: Path) -> List[dict]:
     return turns
 
 
-def _run_scripted_turns(session: Session, registry, llm, turns: Sequence[dict]) -> None:
+def _run_scripted_turns(session: Session, features: dict, turns: Sequence[dict]) -> None:
+    # Turns run strictly in order on purpose: each feature reads the
+    # transcript and session state written by the previous ones (the
+    # clarifier's project overview feeds the later features), so issuing
+    # them concurrently would change the conversation's outputs.
     print(f"Running scripted conversation with {len(turns)} turn(s)...")
     for idx, turn in enumerate(turns, start=1):
         feature_key = turn["feature"]
         message = turn["message"]
         print(f"\nTurn {idx}: {feature_key}\nUser: {message}")
-        result = _invoke_feature(session, registry, llm, feature_key, message)
+        result = _invoke_feature(session, features, feature_key, message)
         if result is None:
             print("  ↳ skipped (unknown feature)")
             continue
@@ -164,7 +214,7 @@ def _run_scripted_turns(session: Session, registry, llm, turns: Sequence[dict])
     _print_state_snapshot(session)
 
 
-def _interactive_loop(session: Session, registry, llm) -> None:
+def _interactive_loop(session: Session, features: dict) -> None:
     print("\nAvailable commands: 'list', 'state', 'history', 'quit'.")
     print("Type a feature key to run it (for example: requirement_clarifier).\n")
     while True:
@@ -180,7 +230,7 @@ def _interactive_loop(session: Session, registry, llm) -> None:
             print("Goodbye!")
             break
         if lowered == "list":
-            _print_feature_catalog(session, registry, llm)
+            _print_feature_catalog(features)
             continue
         if lowered == "state":
             _print_state_snapshot(session)
@@ -192,22 +242,20 @@ def _interactive_loop(session: Session, registry, llm) -> None:
         if not message:
             print("[warn] Empty message; nothing sent.")
             continue
-        result = _invoke_feature(session, registry, llm, lowered, message)
+        result = _invoke_feature(session, features, lowered, message)
         if result is None:
             print(f"[warn] Unknown feature '{lowered}'. Type 'list' to see options.")
             continue
         _print_result(result)
 
 
-def _invoke_feature(session: Session, registry, llm, feature_key: str, message: str):
-    context = FeatureContext(session=session, llm=llm)
-    try:
-        feature = registry.create(feature_key, context)
-    except KeyError:
+def _invoke_feature(session: Session, features: dict, feature_key: str, message: str):
+    feature = features.get(feature_key)
+    if feature is None:
         return None
     session.memory.append("user", message, feature=feature_key)
     try:
-        result = feature.run(message, context=context)
+        result = feature.run(message)
     except Exception as exc:  # pragma: no cover - interactive error handling
         print(f"[error] Feature '{feature_key}' failed: {exc}")
         session.memory.append("assistant", f"Encountered error: {exc}", feature=feature_key)
@@ -215,11 +263,10 @@ def _invoke_feature(session: Session, registry, llm, feature_key: str, message:
     return result
 
 
-def _print_feature_catalog(session: Session, registry, llm) -> None:
-    context = FeatureContext(session=session, llm=llm)
+def _print_feature_catalog(features: dict) -> None:
     print("\nFeatures:")
-    for key in sorted(registry.keys()):
-        feature = registry.create(key, context)
+    for key in sorted(features):
+        feature = features[key]
         print(f" - {feature.name}: {feature.description}")
     print()
 
@@ -254,7 +301,9 @@ def _print_result(result) -> None:
     print(result.summary)
     if result.data:
         try:
-            formatted = json.dumps(result.data, indent=2, ensure_ascii=False)
+            # orjson's JSONEncodeError subclasses TypeError, so unserializable
+            # payloads hit the same str() fallback as before.
+            formatted = orjson.dumps(result.data, option=orjson.OPT_INDENT_2).decode()
         except TypeError:
             formatted = str(result.data)
         print(formatted)